@@ -35,5 +35,10 @@ setuptools.setup(
     ],
     packages=["spotifython"],
     install_requires=requirements,
+    extras_require={
+        "async": ["aiohttp"],
+        "speed": ["orjson"],
+        "zstd": ["zstandard"],
+    },
     python_requires=">=3.10",
 )
@@ -22,7 +22,11 @@ from collections import namedtuple
 import logging
 
 from .client import Client
+from .async_client import AsyncClient
 from .authentication import Authentication
+from .metrics import Metrics
+from .ttl import TTLPolicy
+from .storage import Storage, FileStorage, SQLiteStorage, WriteBehindStorage
 from .user import User
 from .errors import (
     SpotifyException,
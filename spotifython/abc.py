@@ -13,6 +13,7 @@ class Cacheable(ABC):
         self._uri: URI = uri
         self._name: str | None = name
         self._cache: Cache = cache
+        self._requested_time: float | None = None
 
     def __str__(self):
         return self.name
@@ -26,10 +27,12 @@ class Cacheable(ABC):
 
     @property
     def name(self) -> str:
-        if self._name is None:
-            self._cache.load(self._uri)
-        if self._name is not None:
-            return self._name
+        name = self._name
+        # with max_loaded another thread may evict the data before it is read; load again until it is there
+        while name is None and self._cache.load(self._uri):
+            name = self._name
+        if name is not None:
+            return name
         raise Exception("unreachable")
 
     @abstractmethod
@@ -45,10 +48,36 @@ class Cacheable(ABC):
     def make_request(uri: URI, connection: Connection) -> dict:
         pass
 
+    @staticmethod
     @abstractmethod
-    def is_expired(self) -> bool:
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        pass
+
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None] | None:
+        """
+        request the data of multiple elements of this type at once
+
+        :return: data in the order of uris (None for unknown elements) or None if the api has no batch endpoint for this type
+        """
+        del uris, connection
+        return None
+
+    @abstractmethod
+    def _unload(self):
+        """
+        drop the loaded data when the cache evicts it; it is loaded again from storage or the api when it is needed
+        """
         pass
 
+    def is_expired(self) -> bool:
+        """
+        whether the loaded data is older than the :class:`TTLPolicy` of the client allows
+        """
+        return self._cache.ttl_policy.is_expired(type(self), self._requested_time)
+
 
 class Playable(Cacheable, ABC):
     @property
@@ -81,6 +110,7 @@ class PlayContext(Cacheable, ABC):
 
 from .uri import URI
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .cache import Cache
 from .track import Track
 from .episode import Episode
@@ -5,6 +5,7 @@ from .abc import PlayContext
 from .uri import URI
 from .cache import Cache
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .errors import SpotifyException
 from .track import Track
 from .episode import Episode
@@ -47,6 +48,8 @@ class Album(PlayContext):
                         for item in self._items
                     ]
                 }
+            if self._requested_time is not None:
+                ret["requested_time"] = self._requested_time
         return ret
 
     @staticmethod
@@ -55,10 +58,9 @@ class Album(PlayContext):
         assert isinstance(connection, Connection)
         assert uri.type == Album
 
-        offset = 0
         limit = 50
         endpoint = connection.add_parameters_to_endpoint(
-            "albums/{id}".format(id=uri.id), offset=offset, limit=limit
+            "albums/{id}".format(id=uri.id), offset=0, limit=limit
         )
 
         if (response := connection.make_request("GET", endpoint)) is not None:
@@ -67,70 +69,119 @@ class Album(PlayContext):
             raise SpotifyException("api request got no data")
 
         # check for long data that needs paging
-        if data["tracks"]["next"] is not None:
-            while True:
-                offset += limit
-                endpoint = connection.add_parameters_to_endpoint(
-                    "albums/{id}/tracks".format(id=uri.id), offset=offset, limit=limit
-                )
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["tracks"]["items"] += extra_data["items"]
-
-                if extra_data["next"] is None:
-                    break
+        data["tracks"]["items"] += connection.get_remaining_items(
+            "albums/{id}/tracks".format(id=uri.id),
+            first_page=data["tracks"],
+            limit=limit,
+        )
         return data
 
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+        assert uri.type == Album
+
+        limit = 50
+        endpoint = connection.add_parameters_to_endpoint(
+            "albums/{id}".format(id=uri.id), offset=0, limit=limit
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["tracks"]["items"] += await connection.get_remaining_items(
+            "albums/{id}/tracks".format(id=uri.id),
+            first_page=data["tracks"],
+            limit=limit,
+        )
+        return data
+
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None]:
+        assert isinstance(connection, Connection)
+
+        ret = []
+        for i in range(0, len(uris), 20):
+            endpoint = connection.add_parameters_to_endpoint(
+                "albums", ids=",".join(uri.id for uri in uris[i : i + 20])
+            )
+            if (response := connection.make_request("GET", endpoint)) is None:
+                raise SpotifyException("api request got no data")
+
+            for data in response["albums"]:
+                # the batch endpoint only includes the first page of tracks
+                if data is not None:
+                    data["tracks"]["items"] += connection.get_remaining_items(
+                        "albums/{id}/tracks".format(id=data["id"]),
+                        first_page=data["tracks"],
+                        limit=data["tracks"]["limit"],
+                    )
+                ret.append(data)
+        return ret
+
     def load_dict(self, data: dict):
         assert isinstance(data, dict)
         assert str(self._uri) == data["uri"]
 
         self._name = data["name"]
+        self._requested_time = data.get("requested_time")
         self._images = data["images"]
-        self._items = []
-        self._artists = []
+        items = []
+        artists = []
 
         for track in data["tracks"]["items"]:
             if track is None:
                 continue
-            self._items.append(
+            items.append(
                 self._cache.get_track(uri=URI(track["uri"]), name=track["name"])
             )
 
         for artist in data["artists"]:
             if artist is None:
                 continue
-            self._artists.append(
+            artists.append(
                 self._cache.get_artist(uri=URI(artist["uri"]), name=artist["name"])
             )
+        self._items = items
+        self._artists = artists
 
-    def is_expired(self) -> bool:
-        return False
+    def _unload(self):
+        self._artists = None
+        self._items = None
+        self._images = None
+        self._requested_time = None
 
     @property
     def items(self) -> Sequence[Track | Episode]:
-        if self._items is None:
-            self._cache.load(uri=self._uri)
-        if self._items is not None:
-            return self._items.copy()
+        items = self._items
+        while items is None and self._cache.load(uri=self._uri):
+            items = self._items
+        if items is not None:
+            return items.copy()
         raise Exception("unreachable")
 
     @property
     def tracks(self) -> list[Track]:
-        if self._items is None:
-            self._cache.load(uri=self._uri)
-        if self._items is not None:
-            return self._items.copy()
+        items = self._items
+        while items is None and self._cache.load(uri=self._uri):
+            items = self._items
+        if items is not None:
+            return items.copy()
         raise Exception("unreachable")
 
     @property
     def artists(self) -> list[Artist]:
-        if self._artists is None:
-            self._cache.load(uri=self._uri)
-        if self._artists is not None:
-            return self._artists.copy()
+        artists = self._artists
+        while artists is None and self._cache.load(uri=self._uri):
+            artists = self._artists
+        if artists is not None:
+            return artists.copy()
         raise Exception("unreachable")
 
     @property
@@ -140,10 +191,11 @@ class Album(PlayContext):
 
         :return: [{'height': (int | None), 'width': (int | None), 'url': str}]
         """
-        if self._images is None:
-            self._cache.load(uri=self._uri)
-        if self._images is not None:
-            return self._images.copy()
+        images = self._images
+        while images is None and self._cache.load(uri=self._uri):
+            images = self._images
+        if images is not None:
+            return images.copy()
         raise Exception("unreachable")
 
     @staticmethod
@@ -4,6 +4,7 @@ from .errors import SpotifyException
 from .abc import Cacheable
 from .cache import Cache
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .uri import URI
 from .track import Track
 
@@ -76,14 +77,63 @@ class Artist(Cacheable):
         data["requested_time"] = time.time()
         return data
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self._uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24 * 7
-            )  # one week in unix time
-        raise Exception("unreachable")
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "artists/{artist_id}".format(artist_id=uri.id), fields="name,uri"
+        )
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "artists/{artist_id}/top-tracks".format(artist_id=uri.id),
+            fields="tracks(uri,name)",
+        )
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            extra_data = response
+        else:
+            raise SpotifyException("api request got no data")
+        data["tracks"] = extra_data["tracks"]
+
+        data["requested_time"] = time.time()
+        return data
+
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None]:
+        assert isinstance(connection, Connection)
+
+        ret = []
+        for i in range(0, len(uris), 50):
+            endpoint = connection.add_parameters_to_endpoint(
+                "artists", ids=",".join(uri.id for uri in uris[i : i + 50])
+            )
+            if (response := connection.make_request("GET", endpoint)) is None:
+                raise SpotifyException("api request got no data")
+
+            for data in response["artists"]:
+                # top tracks have no batch endpoint
+                if data is not None:
+                    endpoint = connection.add_parameters_to_endpoint(
+                        "artists/{artist_id}/top-tracks".format(artist_id=data["id"]),
+                        fields="tracks(uri,name)",
+                    )
+                    if (extra_data := connection.make_request("GET", endpoint)) is None:
+                        raise SpotifyException("api request got no data")
+                    data["tracks"] = extra_data["tracks"]
+                    data["requested_time"] = time.time()
+                ret.append(data)
+        return ret
+
+    def _unload(self):
+        self._tracks = None
+        self._requested_time = None
 
     @property
     def top_tracks(self) -> list[Track]:
@@ -91,8 +141,9 @@ class Artist(Cacheable):
         get list of the artists top played tracks
 
         """
-        if self._tracks is None:
-            self._cache.load(uri=self._uri)
-        if self._tracks is not None:
-            return self._tracks.copy()
+        tracks = self._tracks
+        while tracks is None and self._cache.load(uri=self._uri):
+            tracks = self._tracks
+        if tracks is not None:
+            return tracks.copy()
         raise Exception("unreachable")
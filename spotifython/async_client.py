@@ -0,0 +1,331 @@
+from collections.abc import AsyncIterator, Sequence
+import json
+
+from .client import Client, _process_uri
+from .async_connection import AsyncConnection
+from .uri import URI
+from .abc import Playable, PlayContext
+from .errors import BadRequestException
+from .user import User
+from .playlist import Playlist
+from .track import Track
+from .episode import Episode
+from .album import Album
+from .artist import Artist
+from .show import Show
+from .me import Me, SavedTracks
+
+
+class AsyncClient:
+    """
+    asyncio interface to the api
+
+    The elements are shared with the wrapped :class:`Client`, so both interfaces return identical objects for the same uri.
+    Properties of elements that are not loaded yet still block; await the getters of this class to load them beforehand.
+
+    :param client: Client to share the cache, authentication and rate limit with
+    :param pool_size: maximum number of simultaneously open connections
+    """
+
+    def __init__(self, client: Client, pool_size: int = 100):
+        assert isinstance(client, Client)
+        assert isinstance(pool_size, int)
+
+        self._client = client
+        self._cache = client._cache
+        self._connection = AsyncConnection(
+            connection=client._connection, pool_size=pool_size
+        )
+
+    @property
+    def client(self) -> Client:
+        """
+        the blocking client sharing this clients elements
+        """
+        return self._client
+
+    async def close(self):
+        """
+        release the network resources held by this client (the wrapped Client has to be closed separately)
+        """
+        await self._connection.close()
+
+    async def load(
+        self,
+        element: URI | str | Playlist | User | Episode | Track | Album | Artist | Show,
+    ):
+        """
+        load the data of an element from cache or the api
+
+        :param element: the element or its uri
+        """
+        if isinstance(element, (URI | str)):
+            uri = _process_uri(uri=element)
+        else:
+            uri = element.uri
+        await self._cache.load_async(uri=uri, connection=self._connection)
+
+    async def get_element(
+        self, uri: URI | str, **kwargs
+    ) -> Playlist | User | Episode | Track | Album | Artist | Show:
+        """
+        return the loaded element with the matching uri
+
+        :param uri: uri of the element
+        """
+        uri = _process_uri(uri=uri)
+        element = self._cache.get_element(uri=uri, **kwargs)
+        await self._cache.load_async(uri=uri, connection=self._connection)
+        return element
+
+    async def get_playlist(self, uri: URI | str, **kwargs) -> Playlist:
+        """
+        return the loaded Playlist object with the given uri
+
+        :param uri: uri of the playlist
+        """
+        element = self._client.get_playlist(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_album(self, uri: URI | str, **kwargs) -> Album:
+        """
+        return the loaded Album object with the given uri
+
+        :param uri: uri of the album
+        """
+        element = self._client.get_album(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_show(self, uri: URI | str, **kwargs) -> Show:
+        """
+        return the loaded Show object with the given uri
+
+        :param uri: uri of the show
+        """
+        element = self._client.get_show(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_episode(self, uri: URI | str, **kwargs) -> Episode:
+        """
+        return the loaded Episode object with the given uri
+
+        :param uri: uri of the episode
+        """
+        element = self._client.get_episode(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_track(self, uri: URI | str, **kwargs) -> Track:
+        """
+        return the loaded Track object with the given uri
+
+        :param uri: uri of the track
+        """
+        element = self._client.get_track(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_artist(self, uri: URI | str, **kwargs) -> Artist:
+        """
+        return the loaded Artist object with the given uri
+
+        :param uri: uri of the artist
+        """
+        element = self._client.get_artist(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_user(self, uri: URI | str, **kwargs) -> User:
+        """
+        return the loaded User object with the given uri
+
+        :param uri: uri of the user
+        """
+        element = self._client.get_user(uri=uri, **kwargs)
+        await self._cache.load_async(uri=element.uri, connection=self._connection)
+        return element
+
+    async def get_me(self) -> Me:
+        """
+        get the loaded profile of the user who is authenticated
+        """
+        element = self._cache.get_me()
+        await self._cache.load_builtin_async(element, "me", connection=self._connection)
+        return element
+
+    async def get_saved_tracks(self) -> SavedTracks:
+        """
+        get the loaded tracks of the current user
+        """
+        # the uri of the saved tracks depends on the profile
+        await self.get_me()
+        element = self._cache.get_saved_tracks()
+        await self._cache.load_builtin_async(
+            element, "saved_tracks", connection=self._connection
+        )
+        return element
+
+    async def iter_playlist_items(self, uri: URI | str) -> AsyncIterator[Playable]:
+        """
+        iterate over the items of a playlist while its pages are requested
+
+        :param uri: uri of the playlist
+        """
+        uri = _process_uri(uri=uri)
+        assert uri.type == Playlist
+
+        async for page in self._connection.iter_pages(
+            "playlists/{playlist_id}/tracks".format(playlist_id=uri.id),
+            limit=100,
+            fields="next,items(added_at,track(name,uri,is_local))",
+        ):
+            for item in page["items"]:
+                if item["track"] is None or item["track"].get("is_local"):
+                    continue
+                yield self._cache.get_element(
+                    uri=URI(item["track"]["uri"]), name=item["track"]["name"]
+                )
+
+    async def iter_saved_tracks(self) -> AsyncIterator[Track]:
+        """
+        iterate over the saved tracks of the current user while their pages are requested
+        """
+        async for page in self._connection.iter_pages(
+            "me/tracks", limit=50, fields="next,items(added_at,track(uri,name))"
+        ):
+            for item in page["items"]:
+                yield self._cache.get_track(
+                    uri=URI(item["track"]["uri"]), name=item["track"]["name"]
+                )
+
+    async def play(
+        self,
+        elements: Sequence[(URI | Playable | str)] | None = None,
+        context: URI | PlayContext | str | None = None,
+        offset: int | None = None,
+        position_ms: int | None = None,
+        device_id: str | None = None,
+    ):
+        """
+        resume playback or play specified resource
+        only one of albums and context may be specified
+
+        :param elements: list of spotify uris or Playable types to play (None to resume playing)
+        :param context: uri or PlayContext to use as context (e.g. playlist or album)
+        :param offset: number of song in resource to start playing (only used if context_uri is set)
+        :param position_ms: position in song to seek (only used if context_uri is set)
+        :param device_id: device to target (None to use currently active device
+        :raises SpotifyException: errors according to http response status
+        """
+        assert isinstance(elements, (list | None))
+        assert isinstance(context, (URI | PlayContext | str | None))
+        assert isinstance(offset, (int | None))
+        assert isinstance(position_ms, (int | None))
+        assert isinstance(device_id, (str | None))
+
+        data = {}
+        send_payload = False
+
+        endpoint = self._connection.add_parameters_to_endpoint(
+            "me/player/play", device_id=device_id
+        )
+
+        if offset is not None:
+            data["offset"] = {"position": offset}
+        if position_ms is not None:
+            data["position_ms"] = position_ms
+
+        if context is not None:
+            data["context_uri"] = str(
+                context.uri if isinstance(context, PlayContext) else context
+            )
+            send_payload = True
+
+        if elements is not None:
+            if send_payload:
+                raise BadRequestException(
+                    "only one of elements and context may be specified"
+                )
+            data["uris"] = []
+            for element in elements:
+                assert isinstance(element, (URI | Playable | str))
+                data["uris"].append(
+                    str(element.uri if isinstance(element, Playable) else element)
+                )
+            send_payload = True
+
+        if send_payload:
+            # play specified resource
+            await self._connection.make_request(
+                method="PUT", endpoint=endpoint, request_data=json.dumps(data)
+            )
+        else:
+            # resume whatever was playing
+            await self._connection.make_request(method="PUT", endpoint=endpoint)
+
+    async def pause(self, device_id: str | None = None):
+        """
+        pause playback
+
+        :param device_id: device to target (None to use currently active device
+        :raises SpotifyException: errors according to http response status
+        """
+        assert isinstance(device_id, (str | None))
+
+        endpoint = self._connection.add_parameters_to_endpoint(
+            "me/player/pause", device_id=device_id
+        )
+
+        await self._connection.make_request(method="PUT", endpoint=endpoint)
+
+    async def next(self, device_id: str | None = None):
+        """
+        skip to next track in queue
+
+        :param device_id:
+        :raises SpotifyException: errors according to http response status
+        """
+        assert isinstance(device_id, (str | None))
+
+        endpoint = self._connection.add_parameters_to_endpoint(
+            "me/player/next", device_id=device_id
+        )
+
+        await self._connection.make_request(method="POST", endpoint=endpoint)
+
+    async def prev(self, device_id: str | None = None):
+        """
+        skip to previous track in queue
+
+        :param device_id:
+        :raises SpotifyException: errors according to http response status
+        """
+        assert isinstance(device_id, (str | None))
+
+        endpoint = self._connection.add_parameters_to_endpoint(
+            "me/player/previous", device_id=device_id
+        )
+
+        await self._connection.make_request(method="POST", endpoint=endpoint)
+
+    async def get_playing(self) -> dict | None:
+        """
+        returns information to playback state
+
+        :return: dict with is_playing, device, repeat_state, shuffle_state, context(playlist), item(track), actions
+        """
+        endpoint = "me/player"
+
+        data = await self._connection.make_request(method="GET", endpoint=endpoint)
+        if data is None:
+            return None
+
+        data["item"] = self._client.get_element_from_data(data["item"])
+        if data["context"] is not None:
+            data["context"] = self._client.get_element_from_data(
+                data["context"], check_outdated=False
+            )
+        return data
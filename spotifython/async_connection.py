@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping
+import asyncio
+import logging
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from .connection import Connection, API_URL
+from .errors import Retry, SpotifyException
+
+log = logging.getLogger(__name__)
+
+
+class AsyncConnection:
+    """
+    asyncio counterpart of :class:`Connection`. Authentication data and rate limit are shared with the wrapped blocking connection.
+
+    :param connection: blocking connection to share the token and rate limit with
+    :param pool_size: maximum number of simultaneously open connections
+    """
+
+    add_parameters_to_endpoint = staticmethod(Connection.add_parameters_to_endpoint)
+
+    def __init__(self, connection: Connection, pool_size: int = 100):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is needed for the asyncio interface (pip install spotifython[async])"
+            )
+        assert isinstance(connection, Connection)
+        assert isinstance(pool_size, int) and pool_size > 0
+
+        self._connection: Connection = connection
+        self._pool_size: int = pool_size
+        # both are bound to the running event loop and created on first use
+        self._session: aiohttp.ClientSession | None = None
+        self._token_lock: asyncio.Lock | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        close all pooled connections
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _refresh_token(self):
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        # only one task waits for a worker thread; the blocking connection skips the request if the token is
+        # already fresh. token requests are rare and may need user interaction, so they run in a worker thread
+        async with self._token_lock:
+            await asyncio.to_thread(self._connection._get_token)
+
+    async def _acquire(self) -> float:
+        waited = 0.0
+        while (delay := self._connection._rate_limiter.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        return waited
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        request_data: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> tuple[dict | None, Mapping[str, str]]:
+        url = API_URL + endpoint
+        if (
+            self._connection._authentication.token is None
+            or self._connection._token_expires_soon()
+        ):
+            await self._refresh_token()
+        if request_data is not None:
+            log.debug("%s %s with %s", method, url, request_data)
+
+        session = self._get_session()
+        metrics = self._connection._metrics
+        retries = 5
+        while retries > 0:
+            waited = await self._acquire()
+            headers = self._connection._get_header()
+            if extra_headers is not None:
+                headers.update(extra_headers)
+            # read once, since metrics may be switched on or off while the request runs
+            recording = metrics.enabled
+            if recording:
+                metrics.record_rate_limit_wait(waited)
+                metrics.before_request(method, endpoint)
+                start = time.perf_counter()
+            async with session.request(
+                method, url, data=request_data, headers=headers
+            ) as response:
+                content = await response.read()
+            if recording:
+                metrics.after_response(
+                    method,
+                    endpoint,
+                    response.status,
+                    time.perf_counter() - start,
+                    len(content),
+                )
+            try:
+                data = self._connection._evaluate_response(
+                    response.status, response.headers, content
+                )
+            except Retry as retry:
+                retries -= 1
+                log.info("retrying (%d)", retries)
+                if recording:
+                    metrics.record_retry(retry.delay)
+                if retry.refresh_token:
+                    await self._refresh_token()
+                if retry.delay > 0:
+                    await asyncio.sleep(retry.delay)
+            else:
+                return data, response.headers
+
+        log.error("request ran out of retries")
+        return None, {}
+
+    async def make_request(
+        self, method: str, endpoint: str, request_data: str | None = None
+    ) -> dict | None:
+        data, _ = await self._send(method, endpoint, request_data=request_data)
+        return data
+
+    async def make_conditional_request(
+        self, endpoint: str, etag: str | None = None
+    ) -> tuple[dict | None, str | None]:
+        """
+        same as :meth:`Connection.make_conditional_request`
+        """
+        data, headers = await self._send(
+            "GET",
+            endpoint,
+            extra_headers={"If-None-Match": etag} if etag is not None else None,
+        )
+        return data, headers.get("ETag")
+
+    async def iter_pages(
+        self, endpoint: str, offset: int = 0, limit: int = 50, **params
+    ) -> AsyncIterator[dict]:
+        """
+        request the pages of a paged collection one after another
+
+        :param endpoint: endpoint of the collection without paging parameters
+        :param offset: index of the first element to request
+        :param limit: number of elements per page
+        :param params: additional query parameters
+        """
+        while True:
+            response = await self._get_page(endpoint, offset, limit, **params)
+            yield response
+
+            if response.get("next") is None:
+                return
+            offset += limit
+
+    async def _get_page(self, endpoint: str, offset: int, limit: int, **params) -> dict:
+        endpoint = self.add_parameters_to_endpoint(
+            endpoint, offset=offset, limit=limit, **params
+        )
+        if (response := await self.make_request("GET", endpoint)) is None:
+            raise SpotifyException("api request got no data")
+        return response
+
+    async def get_remaining_items(
+        self, endpoint: str, first_page: dict, limit: int, **params
+    ) -> list:
+        """
+        request the items of a paged collection that are not part of its first page
+
+        :param endpoint: endpoint of the collection without paging parameters
+        :param first_page: the already requested page at offset 0
+        :param limit: number of items per page
+        :param params: additional query parameters
+        :return: the items in the order of the collection
+        """
+        if first_page.get("next") is None:
+            return []
+
+        items = []
+        if first_page.get("total") is None:
+            # without the total the pages have to be followed one after another
+            async for page in self.iter_pages(
+                endpoint, offset=limit, limit=limit, **params
+            ):
+                items += page["items"]
+            return items
+
+        pages = await asyncio.gather(
+            *(
+                self._get_page(endpoint, offset, limit, **params)
+                for offset in range(limit, first_page["total"], limit)
+            )
+        )
+        for page in pages:
+            items += page["items"]
+        return items
@@ -2,96 +2,1028 @@
 from __future__ import annotations
 
 from abc import ABCMeta
-import json
-import os.path
+import asyncio
+import contextlib
+from contextlib import AbstractContextManager
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
 import logging
 
 from .connection import Connection
-from .errors import ElementOutdated
+from .async_connection import AsyncConnection
+from .errors import (
+    ElementOutdated,
+    NotModified,
+    NotFoundException,
+    ForbiddenException,
+)
+from .singleflight import SingleFlight
+from .storage import Storage, FileStorage, WriteBehindStorage, FILE_MODE
+from .snapshot import Snapshot, write_snapshot
+from . import codec
 
 log = logging.getLogger(__name__)
 
+# events counted per element type by Cache.stats
+_EVENTS = ("memory_hits", "disk_hits", "fetches", "expired")
+
+# errors of the api that are remembered for elements that do not exist or are not available
+_NEGATIVE_ERRORS = {
+    error.__name__: error for error in (NotFoundException, ForbiddenException)
+}
+
+
+def _open_ndjson(path: str, mode: str, compress: bool):
+    """
+    :param mode: "rb" or "wb"
+    :param compress: whether the file is gzip compressed
+    """
+    if compress:
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _deep_size(obj, seen: set[int]) -> int:
+    """
+    :return: approximate bytes used by obj and the objects it holds; other elements and the cache are not included
+    """
+    if id(obj) in seen or isinstance(obj, (Cacheable, Cache, type)):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _deep_size(key, seen) + _deep_size(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list | tuple | set | frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_size(obj.__dict__, seen)
+    return size
+
 
 class Cache:
-    def __init__(self, connection: Connection, cache_dir: str | None = None):
-        self._cache_dir: str | None = cache_dir
+    def __init__(
+        self,
+        connection: Connection,
+        cache_dir: str | None = None,
+        storage: Storage | None = None,
+        max_loaded: int | None = None,
+        weak_references: bool = False,
+        write_behind: bool = False,
+        compression: str | None = None,
+        ttl_policy: TTLPolicy | None = None,
+        collect_stats: bool = False,
+    ):
+        assert cache_dir is None or storage is None
+        assert max_loaded is None or (isinstance(max_loaded, int) and max_loaded > 0)
+        assert isinstance(storage, (Storage | None))
+        assert isinstance(weak_references, bool)
+        assert isinstance(write_behind, bool)
+        codec.check_compression(compression)
+        assert isinstance(ttl_policy, (TTLPolicy | None))
+        assert isinstance(collect_stats, bool)
+
+        if storage is None and cache_dir is not None:
+            storage = FileStorage(cache_dir=cache_dir)
+        if storage is not None and write_behind:
+            storage = WriteBehindStorage(storage=storage)
+        self._storage: Storage | None = storage
+        self._compression: str | None = compression
+        self._snapshot: Snapshot | None = None
+        # keys whose data was requested after the snapshot was taken
+        self._replaced_in_snapshot: set[str] = set()
+        self._ttl_policy: TTLPolicy = (
+            ttl_policy if ttl_policy is not None else TTLPolicy()
+        )
+        # stale elements that are requested again in the background
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        # error name, message and time of the last request of elements the api answered with 404 or 403
+        self._negative: dict[str, tuple[str, str, float]] = {}
         self._connection: Connection = connection
-        self._by_uri: dict[
+        # with weak references elements that are not referenced outside the cache are garbage collected
+        self._weak_references: bool = weak_references
+        mapping = weakref.WeakValueDictionary if weak_references else dict
+        self._by_uri: MutableMapping[
             str, Playlist | User | Episode | Track | Album | Artist | Show | SavedTracks
-        ] = {}
+        ] = mapping()
+        # uris whose data has been loaded, least recently used first
+        self._loaded: OrderedDict[str, None] = OrderedDict()
+        # reentrant since the finalizers of collected elements may run while it is held
+        self._loaded_lock = threading.RLock()
+        self._max_loaded: int | None = max_loaded
+        self._builtins_loaded: set[str] = set()
+        self._flights = SingleFlight()
+        # (type name, event) and ("", "bytes_read" | "bytes_written") counters for stats(); off by default since every
+        # lookup would take the lock
+        self._collect_stats: bool = collect_stats
+        self._stats: Counter[tuple[str, str]] = Counter()
+        self._stats_lock = threading.Lock()
+        # running asyncio loads by uri or builtin name
+        self._async_loads: dict[str, asyncio.Task] = {}
         self._me: Me | None = None
         self._saved_tracks: SavedTracks | None = None
         self._by_type: dict[
             ABCMeta,
-            dict[
+            MutableMapping[
                 str,
                 Playlist | User | Episode | Track | Album | Artist | Show | SavedTracks,
             ],
         ] = {
-            Playlist: {},
-            Episode: {},
-            Track: {},
-            Album: {},
-            Artist: {},
-            Show: {},
-            SavedTracks: {},
-            User: {},
+            Playlist: mapping(),
+            Episode: mapping(),
+            Track: mapping(),
+            Album: mapping(),
+            Artist: mapping(),
+            Show: mapping(),
+            SavedTracks: mapping(),
+            User: mapping(),
         }
 
     @property
     def cache_dir(self) -> str | None:
-        return self._cache_dir
+        storage = self._storage
+        if isinstance(storage, WriteBehindStorage):
+            storage = storage.storage
+        if isinstance(storage, FileStorage):
+            return storage.cache_dir
+        return None
+
+    @property
+    def storage(self) -> Storage | None:
+        return self._storage
+
+    @property
+    def ttl_policy(self) -> TTLPolicy:
+        return self._ttl_policy
+
+    def flush(self):
+        if self._storage is not None:
+            self._storage.flush()
+
+    def close(self):
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        if self._storage is not None:
+            self._storage.close()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    def save_snapshot(self, path: str):
+        """
+        write the data of all cached and loaded elements into a single file that can be opened with :meth:`open_snapshot`
+
+        :param path: path of the file (replaced if it exists)
+        """
+        keys = set()
+        if self._storage is not None:
+            keys.update(self._storage.keys())
+        if self._snapshot is not None:
+            keys.update(self._snapshot.keys())
+
+        # elements that are only held in memory (e.g. without storage)
+        with self._loaded_lock:
+            loaded = [key for key in self._loaded if key not in keys]
+        elements = [(key, self._by_uri.get(key)) for key in loaded]
+        for name, element in (("me", self._me), ("saved_tracks", self._saved_tracks)):
+            if name in self._builtins_loaded and name not in keys:
+                elements.append((name, element))
+
+        entries = [
+            (key, payload)
+            for key in keys
+            if (payload := self._read_payload(key)) is not None
+        ]
+        entries += [
+            (key, self._encode(element)[0])
+            for key, element in elements
+            if element is not None
+        ]
+        write_snapshot(path, entries)
+        log.info("saved %d elements to snapshot %s", len(entries), path)
+
+    def open_snapshot(self, path: str):
+        """
+        load elements from a snapshot file before falling back to the storage; entries are decoded when their element is
+        loaded and the file is memory-mapped, so processes opening the same snapshot share its pages
+
+        :param path: path of a file written by :meth:`save_snapshot`
+        :raises ValueError: if the file is not a snapshot
+        """
+        snapshot = Snapshot(path)
+        if self._snapshot is not None:
+            self._snapshot.close()
+        self._replaced_in_snapshot = set()
+        self._snapshot = snapshot
+
+    def _count(self, type_name: str, event: str, amount: int = 1):
+        if not self._collect_stats:
+            return
+        with self._stats_lock:
+            self._stats[(type_name, event)] += amount
+
+    def stats(self) -> dict:
+        """
+        counters of the loads since the cache was created with collect_stats=True
+
+        :return: {"types": {type name: {"memory_hits": loads answered by already loaded data, "disk_hits": loads answered by the storage or snapshot, "fetches": elements requested from the api, "expired": cached entries that were requested again because they expired}}, "bytes_read": bytes read from the storage and snapshot, "bytes_written": bytes written to the storage}
+        """
+        with self._stats_lock:
+            counts = dict(self._stats)
+        types = {}
+        for (type_name, event), count in counts.items():
+            if type_name:
+                types.setdefault(type_name, dict.fromkeys(_EVENTS, 0))[event] = count
+        return {
+            "types": types,
+            "bytes_read": counts.get(("", "bytes_read"), 0),
+            "bytes_written": counts.get(("", "bytes_written"), 0),
+        }
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats.clear()
+
+    def memory_report(self) -> dict[str, dict[str, int]]:
+        """
+        estimate the memory held by the elements in the cache; walks all elements, so it is meant for debugging
+
+        :return: {type name: {"elements": number of elements, "loaded": number of elements with loaded data, "bytes": approximate size of the elements}}
+        """
+        with self._loaded_lock:
+            loaded = set(self._loaded)
+        loaded.update(self._builtins_loaded)
+
+        groups: list[tuple[str, list[tuple[str, Cacheable]]]] = [
+            (element_type.__name__, list(elements.items()))
+            for element_type, elements in self._by_type.items()
+        ]
+        if self._me is not None:
+            groups.append((Me.__name__, [("me", self._me)]))
+
+        report = {}
+        for type_name, elements in groups:
+            seen: set[int] = set()
+            report[type_name] = {
+                "elements": len(elements),
+                "loaded": sum(
+                    1
+                    for key, element in elements
+                    if key in loaded
+                    or (isinstance(element, SavedTracks) and "saved_tracks" in loaded)
+                ),
+                "bytes": sum(
+                    sys.getsizeof(element) + _deep_size(element.__dict__, seen)
+                    for _, element in elements
+                ),
+            }
+        return report
+
+    def export(self, path: str) -> int:
+        """
+        write every cached element into a file that can be imported with :meth:`import_` (e.g. to start other machines
+        with a warm cache); every line is a json object {"key": key, "data": cached data}
+
+        :param path: path of the file (replaced if it exists); gzip compressed if it ends with .gz
+        :return: number of exported elements
+        """
+        keys = set()
+        if self._storage is not None:
+            keys.update(self._storage.keys())
+        if self._snapshot is not None:
+            keys.update(self._snapshot.keys())
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp"
+        )
+        os.close(fd)
+        count = 0
+        try:
+            with _open_ndjson(tmp_path, "wb", path.endswith(".gz")) as out_file:
+                for key in sorted(keys):
+                    if (payload := self._read_payload(key)) is None:
+                        continue
+                    try:
+                        data = codec.loads(codec.decompress(payload))
+                    except ValueError:
+                        log.warning("not exporting unreadable cache entry %s", key)
+                        continue
+                    out_file.write(codec.dumps({"key": key, "data": data}) + b"\n")
+                    count += 1
+
+                # elements that are only held in memory (e.g. without storage)
+                with self._loaded_lock:
+                    loaded = [key for key in self._loaded if key not in keys]
+                for key in loaded:
+                    if (element := self._by_uri.get(key)) is None:
+                        continue
+                    data = element.to_dict()
+                    out_file.write(codec.dumps({"key": key, "data": data}) + b"\n")
+                    count += 1
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        log.info("exported %d elements to %s", count, path)
+        return count
+
+    def import_(self, path: str, batch_size: int = 500) -> dict[str, int]:
+        """
+        write the elements of a file written by :meth:`export` into the storage; entries that are malformed or expired are
+        skipped and cached entries are only replaced by entries that were requested later
+
+        :param path: path of the file; gzip compressed if it ends with .gz
+        :param batch_size: number of entries written to the storage at once
+        :return: {"imported": number of written entries, "skipped": number of expired or older entries, "invalid": number of malformed entries}
+        """
+        assert self._storage is not None, "importing needs a cache_dir or storage"
+        assert isinstance(batch_size, int) and batch_size > 0
+
+        summary = {"imported": 0, "skipped": 0, "invalid": 0}
+        batch = []
+        with _open_ndjson(path, "rb", path.endswith(".gz")) as in_file:
+            for line_number, line in enumerate(in_file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = codec.loads(line)
+                    key, data = entry["key"], entry["data"]
+                    element_type = self._validate_import(key, data)
+                except (codec.DecodeError, ValueError, KeyError, TypeError) as e:
+                    log.warning(
+                        "invalid entry in line %d of %s: %r", line_number, path, e
+                    )
+                    summary["invalid"] += 1
+                    continue
+
+                if self._import_is_outdated(key, element_type, data):
+                    summary["skipped"] += 1
+                    continue
+
+                payload = codec.compress(codec.dumps(data), self._compression)
+                batch.append(
+                    (key, payload, element_type.__name__, data.get("requested_time"))
+                )
+                self._replaced_in_snapshot.add(key)
+                if "error" not in data:
+                    self._negative.pop(key, None)
+                if len(batch) >= batch_size:
+                    self._storage.write_many(batch)
+                    summary["imported"] += len(batch)
+                    batch = []
+        if batch:
+            self._storage.write_many(batch)
+            summary["imported"] += len(batch)
+
+        log.info(
+            "imported %d elements from %s (%d skipped, %d invalid)",
+            summary["imported"],
+            path,
+            summary["skipped"],
+            summary["invalid"],
+        )
+        return summary
+
+    @staticmethod
+    def _validate_import(key, data) -> ABCMeta:
+        """
+        :return: the element class of the entry
+        :raises ValueError: if the entry is malformed
+        """
+        if not isinstance(key, str) or not isinstance(data, dict):
+            raise ValueError("entry needs a string key and an object as data")
+        requested_time = data.get("requested_time")
+        if requested_time is not None and not isinstance(requested_time, (int | float)):
+            raise ValueError(f"invalid requested_time for {key}")
+
+        element_type = Cache._element_type(key)
+
+        if "error" in data:
+            if data["error"] not in _NEGATIVE_ERRORS or requested_time is None:
+                raise ValueError(f"invalid error entry for {key}")
+        elif key not in ("me", "saved_tracks") and data.get("uri") != key:
+            raise ValueError(f"data of {key} has another uri")
+        return element_type
+
+    def _import_is_outdated(self, key: str, element_type: ABCMeta, data: dict) -> bool:
+        """
+        :return: whether the entry expired or the storage has data that was requested later
+        """
+        requested_time = data.get("requested_time")
+        if "error" in data:
+            if self._ttl_policy.is_negative_expired(requested_time):
+                return True
+        elif self._ttl_policy.is_expired(element_type, requested_time):
+            return True
+
+        if (payload := self._storage.read(key)) is None:
+            return False
+        try:
+            existing = codec.loads(codec.decompress(payload))
+        except ValueError:
+            return False
+        existing_time = existing.get("requested_time")
+        if requested_time is None or existing_time is None:
+            # without times the existing data is kept
+            return True
+        return existing_time >= requested_time
+
+    def _mark_loaded(self, uri: str):
+        with self._loaded_lock:
+            self._loaded[uri] = None
+            self._loaded.move_to_end(uri)
+            if self._max_loaded is None:
+                return
+            evicted = []
+            while len(self._loaded) > self._max_loaded:
+                evicted.append(self._loaded.popitem(last=False)[0])
+            # unloaded under the lock, so a thread loading an element again can not mark it loaded before the old data is
+            # dropped; the elements stay in the identity map and load their data again from storage when it is needed
+            for key in evicted:
+                if key in self._loaded:
+                    continue
+                if (element := self._by_uri.get(key)) is not None:
+                    element._unload()
+                    log.debug("evicted %s", key)
+
+    def _discard_loaded(self, uri: str):
+        with self._loaded_lock:
+            self._loaded.pop(uri, None)
+
+    def _touch(self, uri: str):
+        if self._max_loaded is None:
+            return
+        with self._loaded_lock:
+            if uri in self._loaded:
+                self._loaded.move_to_end(uri)
 
     def get_element(
         self, uri: URI, name: str | None = None, **kwargs
     ) -> Playlist | User | Episode | Track | Album | Artist | Show | SavedTracks:
-        if str(uri) not in self._by_uri.keys():
+        if (element := self._by_uri.get(str(uri))) is None:
             # generate element based on type in uri
-            to_add = uri.type(uri=uri, cache=self, name=name, **kwargs)
-            self._by_uri[str(uri)] = to_add
-            self._by_type[uri.type][str(uri)] = to_add
+            element = self._add(uri.type(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
+
+    def _add(self, element: Cacheable) -> Cacheable:
+        key = str(element.uri)
+        # a new element has no data even if a collected one with the same uri had
+        self._discard_loaded(key)
+        if self._weak_references:
+            weakref.finalize(element, self._discard_loaded, key)
+        self._by_uri[key] = element
+        self._by_type[type(element)][key] = element
+        return element
+
+    def _read_cache(self, name: str) -> dict | None:
+        """
+        :raises NotFoundException | ForbiddenException: if the api answered with the error when name was last requested and it is still remembered
+        """
+        self._raise_if_missing(name)
+        data = self._decode(name, self._read_snapshot(name))
+        if data is None:
+            data = self._decode(name, self._read_storage(name))
+        elif self._storage is not None and self._is_expired_entry(name, data):
+            # another process may have requested the element since the snapshot was taken
+            if (newer := self._decode(name, self._read_storage(name))) is not None:
+                data = newer
+        if data is None:
+            return None
+        if "error" in data:
+            if data["error"] in _NEGATIVE_ERRORS:
+                self._negative[name] = (
+                    data["error"],
+                    data.get("message", ""),
+                    data["requested_time"],
+                )
+                self._raise_if_missing(name)
+            return None
+        data["fetched"] = False
+        return data
+
+    def _read_payload(self, name: str) -> bytes | None:
+        if (payload := self._read_snapshot(name)) is None:
+            payload = self._read_storage(name)
+        return payload
+
+    def _read_snapshot(self, name: str) -> bytes | None:
+        if self._snapshot is None or name in self._replaced_in_snapshot:
+            return None
+        if (payload := self._snapshot.get(name)) is not None:
+            self._count("", "bytes_read", len(payload))
+        return payload
+
+    def _read_storage(self, name: str) -> bytes | None:
+        if self._storage is None:
+            return None
+        if (payload := self._storage.read(name)) is not None:
+            self._count("", "bytes_read", len(payload))
+        return payload
+
+    @staticmethod
+    def _decode(name: str, payload: bytes | None) -> dict | None:
+        if payload is None:
+            return None
+        try:
+            return codec.loads(codec.decompress(payload))
+        except ValueError:
+            log.warning("ignoring unreadable cache entry %s", name)
+            return None
+
+    def _is_expired_entry(self, name: str, data: dict) -> bool:
+        if "error" in data:
+            return self._ttl_policy.is_negative_expired(data["requested_time"])
+        return self._ttl_policy.is_expired(
+            self._element_type(name), data.get("requested_time")
+        )
+
+    @staticmethod
+    def _element_type(key: str) -> ABCMeta:
+        """
+        :return: the element class of a cache key
+        :raises ValueError: if the key is neither a uri nor the name of a builtin element
+        """
+        match key:
+            case "me":
+                return Me
+            case "saved_tracks":
+                return SavedTracks
+        try:
+            return URI(key).type
+        except (AssertionError, AttributeError, KeyError) as e:
+            raise ValueError(f"invalid key {key}") from e
+
+    def _raise_if_missing(self, name: str):
+        if (entry := self._negative.get(name)) is None:
+            return
+        error, message, requested_time = entry
+        if self._ttl_policy.is_negative_expired(requested_time):
+            self._negative.pop(name, None)
+            return
+        log.debug("%s is known to be unavailable", name)
+        raise _NEGATIVE_ERRORS[error](message)
+
+    def _forget_missing(self, name: str):
+        self._negative.pop(name, None)
+        if self._storage is not None:
+            self._storage.delete(name)
+
+    def _remember_missing(
+        self,
+        name: str,
+        element: Cacheable,
+        error: NotFoundException | ForbiddenException,
+    ):
+        """
+        remember that the api answered the request of an element with an error, so it is raised again without a request
+        """
+        if self._ttl_policy.negative_ttl == 0:
+            return
+        data = {
+            "error": type(error).__name__,
+            "message": str(error),
+            "requested_time": time.time(),
+        }
+        self._negative[name] = (data["error"], data["message"], data["requested_time"])
+        self._replaced_in_snapshot.add(name)
+        if self._storage is None:
+            return
+        payload = codec.compress(codec.dumps(data), self._compression)
+        self._count("", "bytes_written", len(payload))
+        # same type as the element, so that its data replaces the error once it is available again
+        self._storage.write(
+            name,
+            payload,
+            type_name=type(element).__name__,
+            requested_time=data["requested_time"],
+        )
+        log.debug("remembered %s for %s", data["error"], name)
+
+    def _encode(self, element: Cacheable) -> tuple[bytes, dict]:
+        data = element.to_dict()
+        return (
+            codec.compress(codec.dumps(data), self._compression),
+            data,
+        )
+
+    def _write_cache(self, name: str, element: Cacheable):
+        # the snapshot has older data now
+        self._replaced_in_snapshot.add(name)
+        self._negative.pop(name, None)
+        if self._storage is None:
+            return
+        payload, data = self._encode(element)
+        self._count("", "bytes_written", len(payload))
+        self._storage.write(
+            name,
+            payload,
+            type_name=type(element).__name__,
+            requested_time=data.get("requested_time"),
+        )
+        log.debug("requested and cached %s", name)
+
+    def _lock_storage(self, name: str) -> AbstractContextManager[bool]:
+        if self._storage is None:
+            return contextlib.nullcontext(False)
+        return self._storage.lock(name)
+
+    def _load_cached(self, element: Cacheable, data: dict, name: str) -> bool:
+        """
+        :return: whether the cached data was valid and may be used
+        """
+        try:
+            element.load_dict(data)
+        except (KeyError, ElementOutdated):
+            # maybe cache is outdated
+            return False
+        if not element.is_expired():
+            self._count(type(element).__name__, "disk_hits")
+            return True
+        self._count(type(element).__name__, "expired")
+        if self._ttl_policy.is_usable_stale(type(element), element._requested_time):
+            self._refresh_in_background(element, name, data)
+            self._count(type(element).__name__, "disk_hits")
+            return True
+        return False
+
+    def _request(
+        self, element: Cacheable, uri: URI | None, name: str, cached: dict | None
+    ) -> dict:
+        self._count(type(element).__name__, "fetches")
+        try:
+            if cached is None or cached.get("etag") is None:
+                data = element.make_request(uri=uri, connection=self._connection)
+            else:
+                try:
+                    data = element.make_request(
+                        uri=uri, connection=self._connection, etag=cached["etag"]
+                    )
+                except NotModified:
+                    data = self._revalidated(name, cached)
+        except (NotFoundException, ForbiddenException) as e:
+            # builtin elements fail with 403 for missing scopes, which a new authentication may fix
+            if uri is not None:
+                self._remember_missing(name, element, e)
+            raise
+        data["fetched"] = True
+        data.setdefault("requested_time", time.time())
+        return data
+
+    def _refresh_in_background(self, element: Cacheable, name: str, cached: dict):
+        with self._refresh_lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="spotifython-refresh"
+                )
+        log.debug("using stale %s while requesting it again", name)
+        self._refresh_executor.submit(self._refresh, element, name, cached)
+
+    def _refresh(self, element: Cacheable, name: str, cached: dict):
+        # builtin elements are requested without uri
+        uri = None if isinstance(element, (Me, SavedTracks)) else element.uri
+        try:
+            with self._lock_storage(name):
+                data = self._request(element, uri, name, cached)
+                element.load_dict(data)
+                self._write_cache(name, element)
+        except Exception:
+            log.exception("failed to refresh %s", name)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(name)
 
-        return self._by_uri[str(uri)]
+    @staticmethod
+    def _revalidated(name: str, cached: dict) -> dict:
+        """
+        :return: the cached data marked as fresh after the api confirmed it did not change
+        """
+        log.debug("%s not modified", name)
+        cached["requested_time"] = time.time()
+        return cached
 
-    def load(self, uri: URI):
+    def load(self, uri: URI) -> bool:
+        """
+        :return: whether data was loaded (False if the element was already loaded)
+        """
         assert isinstance(uri, URI)
 
+        # concurrent loads of the same element wait for the first one
+        return self._flights.do(str(uri), lambda: self._load(uri))
+
+    def _load(self, uri: URI) -> bool:
         element = self.get_element(uri)
+        if str(uri) in self._loaded:
+            self._count(uri.type.__name__, "memory_hits")
+            return False
 
         # try to load from cache
-        if self._cache_dir is not None:
-            path = os.path.join(self._cache_dir, str(uri))
-            try:
-                with open(path, "r") as in_file:
-                    data = json.load(in_file)
-                    data["fetched"] = False
-            except (FileNotFoundError, json.JSONDecodeError):
-                # request new data
-                data = element.make_request(uri=uri, connection=self._connection)
-                data["fetched"] = True
-        else:
-            data = element.make_request(uri=uri, connection=self._connection)
-            data["fetched"] = True
+        cached = self._read_cache(str(uri))
+        if cached is not None and self._load_cached(element, cached, str(uri)):
+            log.debug("loaded %s from cache", str(uri))
+            self._mark_loaded(str(uri))
+            return True
 
-        try:
+        # only one process requests the element, the others wait for the lock and read what it cached
+        with self._lock_storage(str(uri)) as waited:
+            if waited:
+                cached = self._read_cache(str(uri))
+                if cached is not None and self._load_cached(element, cached, str(uri)):
+                    log.debug("loaded %s from cache", str(uri))
+                    self._mark_loaded(str(uri))
+                    return True
+
+            # request new data
+            data = self._request(element, uri, str(uri), cached)
             element.load_dict(data=data)
-            if element.is_expired():
-                raise ElementOutdated()
-        except (KeyError, ElementOutdated):
-            # maybe cache is outdated
-            data = element.make_request(uri=uri, connection=self._connection)
+            self._mark_loaded(str(uri))
+
+            self._write_cache(str(uri), element)
+        return True
+
+    def _load_from_cache(self, element: Cacheable) -> bool:
+        """
+        :return: whether the element is loaded from memory or storage
+        """
+        if str(element.uri) in self._loaded:
+            self._count(type(element).__name__, "memory_hits")
+            return True
+        data = self._read_cache(str(element.uri))
+        if data is not None and self._load_cached(element, data, str(element.uri)):
+            log.debug("loaded %s from cache", str(element.uri))
+            self._mark_loaded(str(element.uri))
+            return True
+        return False
+
+    def _load_batch(self, elements: list[Cacheable]) -> list[Cacheable] | None:
+        """
+        request the data of elements of the same type through the batch endpoint of their type
+
+        :return: the elements the api returned no data for or None if there is no batch endpoint
+        """
+        datas = type(elements[0]).make_batch_request(
+            uris=[element.uri for element in elements], connection=self._connection
+        )
+        if datas is None:
+            return None
+        self._count(type(elements[0]).__name__, "fetches", len(elements))
+
+        missing = []
+        for element, data in zip(elements, datas):
+            if data is None:
+                log.warning("api returned no data for %s", str(element.uri))
+                self._remember_missing(
+                    str(element.uri),
+                    element,
+                    NotFoundException(f"api returned no data for {element.uri}"),
+                )
+                missing.append(element)
+                continue
             data["fetched"] = True
+            data.setdefault("requested_time", time.time())
             element.load_dict(data=data)
+            self._mark_loaded(str(element.uri))
+
+            self._write_cache(str(element.uri), element)
+        return missing
+
+    def load_many(self, uris: Iterable[URI]):
+        """
+        load the data of multiple elements; elements without valid cache are requested through the batch endpoints of the api where possible
+        """
+        # the elements are kept until their data arrives since the cache may only hold weak references
+        to_request: dict[ABCMeta, list[Cacheable]] = {}
+        for uri in uris:
+            assert isinstance(uri, URI)
+            element = self.get_element(uri)
+            try:
+                if not self._load_from_cache(element):
+                    to_request.setdefault(uri.type, []).append(element)
+            except (NotFoundException, ForbiddenException):
+                # like elements the batch endpoints return no data for
+                continue
+
+        for elements in to_request.values():
+            if self._load_batch(elements) is None:
+                for element in elements:
+                    self.load(element.uri)
+
+    def prefetch(self, uris: Iterable[URI], max_workers: int = 8) -> dict[str, int]:
+        """
+        load the data of multiple elements concurrently; elements without valid cache are requested through the batch endpoints of the api where possible
+
+        :param uris: uris of the elements
+        :param max_workers: maximum number of threads reading the storage and requesting the api
+        :return: {"hits": number of elements loaded from memory or storage, "misses": number of elements requested, "failures": number of elements that could not be requested or are known to be unavailable}
+        """
+        assert isinstance(max_workers, int) and max_workers > 0
+
+        # URI compares by identity; equal uris are the same element
+        unique = {str(uri): uri for uri in uris}
+        elements = [self.get_element(uri) for uri in unique.values()]
+        summary = {"hits": 0, "misses": 0, "failures": 0}
 
-        if not data["fetched"]:
+        def load_from_cache(element: Cacheable) -> bool | None:
+            """
+            :return: None if the element is known to be unavailable
+            """
+            try:
+                return self._load_from_cache(element)
+            except (NotFoundException, ForbiddenException):
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="spotifython-prefetch"
+        ) as executor:
+            to_request: dict[ABCMeta, list[Cacheable]] = {}
+            for element, hit in zip(elements, executor.map(load_from_cache, elements)):
+                if hit is None:
+                    summary["failures"] += 1
+                elif hit:
+                    summary["hits"] += 1
+                else:
+                    to_request.setdefault(type(element), []).append(element)
+
+            futures = {}
+            for element_type, type_elements in to_request.items():
+                if element_type.make_batch_request is Cacheable.make_batch_request:
+                    for element in type_elements:
+                        futures[executor.submit(self.load, element.uri)] = [element]
+                    continue
+                # the batch endpoints take at most 50 ids; requesting the chunks concurrently
+                for i in range(0, len(type_elements), 50):
+                    chunk = type_elements[i : i + 50]
+                    futures[executor.submit(self._load_batch, chunk)] = chunk
+
+            for future, chunk in futures.items():
+                try:
+                    missing = future.result()
+                except Exception as e:
+                    log.warning(
+                        "failed to prefetch %s: %r",
+                        ", ".join(str(element.uri) for element in chunk),
+                        e,
+                    )
+                    summary["failures"] += len(chunk)
+                    continue
+                failed = len(missing) if isinstance(missing, list) else 0
+                summary["failures"] += failed
+                summary["misses"] += len(chunk) - failed
+
+        return summary
+
+    def sync_library(self, max_workers: int = 8) -> dict[str, int]:
+        """
+        request the listing of the saved playlists and compare their snapshot ids with the cached ones; only the playlists
+        whose snapshot changed are requested again, the others count as up to date even if their cache expired
+
+        :param max_workers: maximum number of threads requesting changed playlists
+        :return: {"unchanged": number of playlists that did not change, "changed": number of playlists requested again, "failures": number of playlists that could not be requested}
+        """
+        assert isinstance(max_workers, int) and max_workers > 0
+
+        me = self.get_me()
+        # requesting the library includes the listing; only cached data needs a new one
+        if (requested := self.load_builtin(me, "me")) is not None:
+            listing = requested["playlists"]
+        else:
+            listing = Me.make_playlists_request(connection=self._connection)
+
+            data = me.to_dict()
+            data["playlists"] = listing
+            me.load_dict(data)
+
+        summary = {"unchanged": 0, "changed": 0, "failures": 0}
+        changed: list[Playlist] = []
+        for item in listing["items"]:
+            if item == {}:
+                continue
+            key = item["uri"]
+            playlist = self.get_playlist(
+                uri=URI(key), name=item["name"], snapshot_id=item["snapshot_id"]
+            )
+
+            cached = None
+            if loaded := key in self._loaded:
+                snapshot_id = playlist._snapshot_id
+            else:
+                try:
+                    cached = self._read_cache(key)
+                except (NotFoundException, ForbiddenException):
+                    # the playlist is listed, so the remembered error is outdated
+                    self._forget_missing(key)
+                snapshot_id = None if cached is None else cached.get("snapshot_id")
+            # loading data with another snapshot id raises ElementOutdated, so load requests the playlist again
+            playlist._snapshot_id = item["snapshot_id"]
+
+            if snapshot_id != item["snapshot_id"]:
+                changed.append(playlist)
+                continue
+            summary["unchanged"] += 1
+
+            # the listing confirmed the cached data, so it counts as requested now
+            if loaded:
+                if playlist.is_expired():
+                    playlist._requested_time = time.time()
+                    self._write_cache(key, playlist)
+            elif self._ttl_policy.is_expired(Playlist, cached.get("requested_time")):
+                cached["requested_time"] = time.time()
+                playlist.load_dict(cached)
+                self._mark_loaded(key)
+                self._write_cache(key, playlist)
+
+        # the cached library has to list the new snapshot ids or the playlists would count as outdated when loaded
+        self._write_cache("me", me)
+
+        for playlist in changed:
+            self._discard_loaded(str(playlist.uri))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="spotifython-sync"
+        ) as executor:
+            futures = {
+                executor.submit(self.load, playlist.uri): playlist
+                for playlist in changed
+            }
+        for future, playlist in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                log.warning("failed to sync %s: %r", str(playlist.uri), e)
+                summary["failures"] += 1
+                continue
+            summary["changed"] += 1
+
+        log.info(
+            "synced library: %d playlists unchanged, %d changed",
+            summary["unchanged"],
+            summary["changed"],
+        )
+        return summary
+
+    async def load_async(self, uri: URI, connection: AsyncConnection):
+        """
+        same as :meth:`load` but requests missing data through the given asyncio connection
+        """
+        assert isinstance(uri, URI)
+
+        if str(uri) in self._loaded:
+            self._count(uri.type.__name__, "memory_hits")
+            return
+
+        # concurrent loads of the same element wait for the first one
+        if (task := self._async_loads.get(str(uri))) is None:
+            task = asyncio.ensure_future(self._load_async(uri, connection))
+            self._async_loads[str(uri)] = task
+            task.add_done_callback(lambda _: self._async_loads.pop(str(uri), None))
+        # a cancelled caller must not cancel the load for the others
+        await asyncio.shield(task)
+
+    async def _load_async(self, uri: URI, connection: AsyncConnection):
+        element = self.get_element(uri)
+
+        # storage io runs in a thread, so a slow disk does not stall the other lookups of the event loop
+        cached = await asyncio.to_thread(self._read_cache, str(uri))
+        if cached is not None and self._load_cached(element, cached, str(uri)):
             log.debug("loaded %s from cache", str(uri))
+            self._mark_loaded(str(uri))
+            return
+
+        self._count(type(element).__name__, "fetches")
+        try:
+            if cached is None or cached.get("etag") is None:
+                data = await element.make_request_async(uri=uri, connection=connection)
+            else:
+                try:
+                    data = await element.make_request_async(
+                        uri=uri, connection=connection, etag=cached["etag"]
+                    )
+                except NotModified:
+                    data = self._revalidated(str(uri), cached)
+        except (NotFoundException, ForbiddenException) as e:
+            await asyncio.to_thread(self._remember_missing, str(uri), element, e)
+            raise
+        data["fetched"] = True
+        data.setdefault("requested_time", time.time())
+        element.load_dict(data=data)
+        self._mark_loaded(str(uri))
 
-        # cache if needed
-        if data["fetched"] and self._cache_dir is not None:
-            path = os.path.join(self._cache_dir, str(uri))
-            with open(path, "w") as out_file:
-                json.dump(element.to_dict(), out_file)
-                log.debug("requested and cached %s", str(uri))
+        await asyncio.to_thread(self._write_cache, str(uri), element)
 
     def get_me(self, **kwargs) -> Me:
         if self._me is None:
@@ -100,117 +1032,145 @@ class Cache:
 
     def get_saved_tracks(self, **kwargs) -> SavedTracks:
         if self._saved_tracks is None:
-            to_add = SavedTracks(cache=self, **kwargs)
-            self._saved_tracks = to_add
-            self._by_uri[str(to_add.uri)] = to_add
-            self._by_type[SavedTracks][str(to_add.uri)] = to_add
+            self._saved_tracks = self._add(SavedTracks(cache=self, **kwargs))
         return self._saved_tracks
 
-    def load_builtin(self, element: Me | SavedTracks, name: str):
-        # try to load from cache
-        if self._cache_dir is not None:
-            path = os.path.join(self._cache_dir, name)
-            try:
-                with open(path, "r") as in_file:
-                    data = json.load(in_file)
-                    data["fetched"] = False
-            except (FileNotFoundError, json.JSONDecodeError):
-                # request new data
-                data = element.make_request(uri=None, connection=self._connection)
-                data["fetched"] = True
-        else:
-            data = element.make_request(uri=None, connection=self._connection)
-            data["fetched"] = True
+    def load_builtin(self, element: Me | SavedTracks, name: str) -> dict | None:
+        """
+        :return: the data requested from the api; None if it was loaded from memory or storage
+        """
+        return self._flights.do(name, lambda: self._load_builtin(element, name))
 
-        try:
-            element.load_dict(data)
-            if element.is_expired():
-                raise ElementOutdated()
-        except (KeyError, ElementOutdated):
-            # maybe cache is outdated
-            data = element.make_request(uri=None, connection=self._connection)
-            data["fetched"] = True
+    def _load_builtin(self, element: Me | SavedTracks, name: str) -> dict | None:
+        if name in self._builtins_loaded:
+            self._count(type(element).__name__, "memory_hits")
+            return None
+
+        data = self._read_cache(name)
+        if data is not None and self._load_cached(element, data, name):
+            self._builtins_loaded.add(name)
+            return None
+
+        with self._lock_storage(name) as waited:
+            if waited:
+                data = self._read_cache(name)
+                if data is not None and self._load_cached(element, data, name):
+                    self._builtins_loaded.add(name)
+                    return None
+
+            data = self._request(element, None, name, None)
             element.load_dict(data)
+            self._builtins_loaded.add(name)
+
+            self._write_cache(name, element)
+            return data
+
+    async def load_builtin_async(
+        self, element: Me | SavedTracks, name: str, connection: AsyncConnection
+    ):
+        """
+        same as :meth:`load_builtin` but requests missing data through the given asyncio connection
+        """
+        if name in self._builtins_loaded:
+            self._count(type(element).__name__, "memory_hits")
+            return
+
+        # concurrent loads wait for the first one; builtin names never collide with uris
+        if (task := self._async_loads.get(name)) is None:
+            task = asyncio.ensure_future(
+                self._load_builtin_async(element, name, connection)
+            )
+            self._async_loads[name] = task
+            task.add_done_callback(lambda _: self._async_loads.pop(name, None))
+        # a cancelled caller must not cancel the load for the others
+        await asyncio.shield(task)
+
+    async def _load_builtin_async(
+        self, element: Me | SavedTracks, name: str, connection: AsyncConnection
+    ):
+        data = await asyncio.to_thread(self._read_cache, name)
+        if data is not None and self._load_cached(element, data, name):
+            self._builtins_loaded.add(name)
+            return
+
+        self._count(type(element).__name__, "fetches")
+        data = await element.make_request_async(uri=None, connection=connection)
+        data["fetched"] = True
+        data.setdefault("requested_time", time.time())
+        element.load_dict(data)
+        self._builtins_loaded.add(name)
 
-        # cache if needed
-        if data["fetched"] and self._cache_dir is not None:
-            path = os.path.join(self._cache_dir, name)
-            with open(path, "w") as out_file:
-                json.dump(element.to_dict(), out_file)
+        await asyncio.to_thread(self._write_cache, name, element)
 
     # get cached objects and create them if needed
     def get_track(self, uri: URI, name: str | None = None, **kwargs) -> Track:
         assert isinstance(uri, URI)
         assert uri.type == Track
 
-        if str(uri) not in self._by_type[Track].keys():
-            to_add = Track(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Track][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Track][str(uri)]
+        if (element := self._by_type[Track].get(str(uri))) is None:
+            element = self._add(Track(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
     def get_playlist(self, uri: URI, name: str | None = None, **kwargs) -> Playlist:
         assert isinstance(uri, URI)
         assert uri.type == Playlist
 
-        if str(uri) not in self._by_type[Playlist].keys():
-            to_add = Playlist(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Playlist][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Playlist][str(uri)]
+        if (element := self._by_type[Playlist].get(str(uri))) is None:
+            element = self._add(Playlist(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
     def get_album(self, uri: URI, name: str | None = None, **kwargs) -> Album:
         assert isinstance(uri, URI)
         assert uri.type == Album
 
-        if str(uri) not in self._by_type[Album].keys():
-            to_add = Album(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Album][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Album][str(uri)]
+        if (element := self._by_type[Album].get(str(uri))) is None:
+            element = self._add(Album(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
     def get_artist(self, uri: URI, name: str | None = None, **kwargs) -> Artist:
         assert isinstance(uri, URI)
         assert uri.type == Artist
 
-        if str(uri) not in self._by_type[Artist].keys():
-            to_add = Artist(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Artist][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Artist][str(uri)]
+        if (element := self._by_type[Artist].get(str(uri))) is None:
+            element = self._add(Artist(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
     def get_user(self, uri: URI, display_name: str | None = None, **kwargs) -> User:
         assert isinstance(uri, URI)
         assert uri.type == User
 
-        if str(uri) not in self._by_type[User].keys():
-            to_add = User(uri=uri, cache=self, display_name=display_name, **kwargs)
-            self._by_type[User][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[User][str(uri)]
+        if (element := self._by_type[User].get(str(uri))) is None:
+            element = self._add(
+                User(uri=uri, cache=self, display_name=display_name, **kwargs)
+            )
+        self._touch(str(uri))
+        return element
 
     def get_episode(self, uri: URI, name: str | None = None, **kwargs) -> Episode:
         assert isinstance(uri, URI)
         assert uri.type == Episode
 
-        if str(uri) not in self._by_type[Episode].keys():
-            to_add = Show(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Episode][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Episode][str(uri)]
+        if (element := self._by_type[Episode].get(str(uri))) is None:
+            element = self._add(Episode(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
     def get_show(self, uri: URI, name: str | None = None, **kwargs) -> Show:
         assert isinstance(uri, URI)
         assert uri.type == Show
 
-        if str(uri) not in self._by_type[Show].keys():
-            to_add = Show(uri=uri, cache=self, name=name, **kwargs)
-            self._by_type[Show][str(uri)] = to_add
-            self._by_uri[str(uri)] = to_add
-        return self._by_type[Show][str(uri)]
+        if (element := self._by_type[Show].get(str(uri))) is None:
+            element = self._add(Show(uri=uri, cache=self, name=name, **kwargs))
+        self._touch(str(uri))
+        return element
 
 
 from .uri import URI
+from .abc import Cacheable
 from .user import User
 from .playlist import Playlist
 from .episode import Episode
@@ -219,3 +1179,4 @@ from .artist import Artist
 from .album import Album
 from .show import Show
 from .me import Me, SavedTracks
+from .ttl import TTLPolicy
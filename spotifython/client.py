@@ -1,8 +1,12 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 import json
 
 from .connection import Connection
+from .ratelimit import RateLimiter
+from .metrics import Metrics
 from .cache import Cache
+from .storage import Storage
+from .ttl import TTLPolicy
 from .user import User
 from .playlist import Playlist
 from .track import Track
@@ -30,14 +34,143 @@ class Client:
 
     :param authentication: Authentication object for client authentication
     :param cache_dir: global path to the directory that this library should cache data in (note that sensitive data you request may be cached, set to None to disable caching)
+    :param storage: backend to cache data in instead of cache_dir (e.g. :class:`SQLiteStorage`)
+    :param max_loaded: maximum number of elements to keep loaded in memory; the data of the least recently used ones is dropped and loaded again from the cache (or the api without cache) when it is needed (None for no limit)
+    :param weak_references: whether to let elements that are no longer referenced outside the client be garbage collected (getters still return the same object while it is alive)
+    :param write_behind: whether to write the cache from a background thread instead of before returning the requested data (see :meth:`flush`)
+    :param compression: "zlib" or "zstd" (needs zstandard before python 3.14) to compress cached data (None to store it uncompressed); the cache can be read regardless of the compression it was written with
+    :param ttl_policy: how long cached data stays valid and whether expired data is used while it is requested again (None for the defaults)
+    :param pool_size: maximum number of keep-alive connections to the api (raise this if you use the client from many threads)
+    :param requests_per_second: average number of requests this client may send (None to only slow down when the api asks for it)
+    :param burst: number of requests that may be sent at once before requests_per_second applies
+    :param page_workers: maximum number of pages of one long collection (e.g. playlist) that are requested at the same time
+    :param refresh_margin: seconds before expiry at which the access token is refreshed
+    :param background_refresh: whether to refresh the access token on a background timer (only if a refresh token is available)
+    :param collect_metrics: whether to record latency, status codes and retries of the requests (see :attr:`metrics`)
+    :param collect_stats: whether to count memory hits, disk hits and fetches of the cache (see :meth:`cache_stats`)
     """
 
-    def __init__(self, authentication: Authentication, cache_dir: str | None = None):
+    def __init__(
+        self,
+        authentication: Authentication,
+        cache_dir: str | None = None,
+        storage: Storage | None = None,
+        max_loaded: int | None = None,
+        weak_references: bool = False,
+        write_behind: bool = False,
+        compression: str | None = None,
+        ttl_policy: TTLPolicy | None = None,
+        pool_size: int = 10,
+        requests_per_second: float | None = None,
+        burst: int = 10,
+        page_workers: int = 8,
+        refresh_margin: float = 60.0,
+        background_refresh: bool = True,
+        collect_metrics: bool = False,
+        collect_stats: bool = False,
+    ):
         assert isinstance(cache_dir, (str | None))
+        assert isinstance(storage, (Storage | None))
+        assert cache_dir is None or storage is None
         assert isinstance(authentication, Authentication)
+        assert isinstance(pool_size, int)
+
+        self._metrics = Metrics(enabled=collect_metrics)
+        self._connection = Connection(
+            authentication=authentication,
+            pool_size=pool_size,
+            rate_limiter=RateLimiter(rate=requests_per_second, burst=burst),
+            page_workers=page_workers,
+            refresh_margin=refresh_margin,
+            background_refresh=background_refresh,
+            metrics=self._metrics,
+        )
+        self._cache = Cache(
+            connection=self._connection,
+            cache_dir=cache_dir,
+            storage=storage,
+            max_loaded=max_loaded,
+            weak_references=weak_references,
+            write_behind=write_behind,
+            compression=compression,
+            ttl_policy=ttl_policy,
+            collect_stats=collect_stats,
+        )
+
+    def close(self):
+        """
+        release the network resources and the cache storage held by this client
+        """
+        self._connection.close()
+        self._cache.close()
+
+    def flush(self):
+        """
+        block until all cached data is written (only needed with write_behind)
+        """
+        self._cache.flush()
+
+    def save_snapshot(self, path: str):
+        """
+        write the data of all cached and loaded elements into a single file that other clients can start from (see
+        :meth:`open_snapshot`)
+
+        :param path: path of the file (replaced if it exists)
+        """
+        self._cache.save_snapshot(path)
+
+    def open_snapshot(self, path: str):
+        """
+        use a file written by :meth:`save_snapshot` as read-only cache that is checked before cache_dir or storage;
+        the file is memory-mapped and elements are only decoded when they are used, so opening it is fast regardless of its size
+
+        :param path: path of the snapshot
+        :raises ValueError: if the file is not a snapshot
+        """
+        self._cache.open_snapshot(path)
+
+    def export_cache(self, path: str) -> int:
+        """
+        write every cached element into one file (newline delimited json) that other clients can import with
+        :meth:`import_cache`, so they start with a warm cache instead of requesting everything again
+
+        :param path: path of the file (replaced if it exists); gzip compressed if it ends with .gz
+        :return: number of exported elements
+        """
+        return self._cache.export(path)
+
+    def import_cache(self, path: str) -> dict[str, int]:
+        """
+        add the elements of a file written by :meth:`export_cache` to cache_dir or storage; malformed and expired entries
+        are skipped and cached elements are only replaced by data that was requested later
 
-        self._connection = Connection(authentication=authentication)
-        self._cache = Cache(connection=self._connection, cache_dir=cache_dir)
+        :param path: path of the file; gzip compressed if it ends with .gz
+        :return: {"imported": number of imported elements, "skipped": number of expired or older elements, "invalid": number of malformed entries}
+        """
+        return self._cache.import_(path)
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        request statistics of this client (set metrics.enabled to start or stop recording)
+        """
+        return self._metrics
+
+    def cache_stats(self) -> dict:
+        """
+        hits and misses of the cache since the client was created (only counted with collect_stats=True)
+
+        :return: {"types": {type name: {"memory_hits": loads answered by already loaded data, "disk_hits": loads answered by the cache files, "fetches": elements requested from the api, "expired": cached elements requested again because they expired}}, "bytes_read": bytes read from the cache, "bytes_written": bytes written to the cache}
+        """
+        return self._cache.stats()
+
+    def memory_report(self) -> dict[str, dict[str, int]]:
+        """
+        estimate the memory used by the cached elements; walks all elements, so it is meant for debugging
+
+        :return: {type name: {"elements": number of elements, "loaded": number of elements with loaded data, "bytes": approximate size of the elements}}
+        """
+        return self._cache.memory_report()
 
     def get_authentication_data(self) -> dict[str, (str | int | None)]:
         """
@@ -384,6 +517,96 @@ class Client:
 
         return self._cache.get_user(uri=uri, **kwargs)
 
+    def prefetch(
+        self, uris: Iterable[URI | str], max_workers: int = 8
+    ) -> dict[str, int]:
+        """
+        load the data of many elements concurrently so later access does not need to wait for the api;
+        elements with valid cache are not requested and the others are requested through batch endpoints where possible
+
+        :param uris: uris of the elements
+        :param max_workers: maximum number of threads reading the cache and requesting the api
+        :return: {"hits": number of elements loaded from cache, "misses": number of elements requested, "failures": number of elements that could not be requested or are known to be unavailable}
+        """
+        return self._cache.prefetch(
+            uris=[_process_uri(uri=uri) for uri in uris], max_workers=max_workers
+        )
+
+    def sync_library(self, max_workers: int = 8) -> dict[str, int]:
+        """
+        bring the saved playlists up to date with one listing of the library; only playlists whose snapshot id changed are
+        requested again, the cache of the others is kept (and counts as fresh again if it expired)
+
+        :param max_workers: maximum number of playlists requested at the same time
+        :return: {"unchanged": number of playlists that did not change, "changed": number of playlists requested again, "failures": number of playlists that could not be requested}
+        """
+        return self._cache.sync_library(max_workers=max_workers)
+
+    def get_tracks(self, uris: Sequence[URI | str]) -> list[Track]:
+        """
+        return loaded Track objects for the given uris using as few requests as possible
+
+        :param uris: uris of the tracks
+        """
+        uris = [_process_uri(uri=uri) for uri in uris]
+        # hold the elements while they are loaded in case the cache only references them weakly
+        elements = [self._cache.get_track(uri=uri) for uri in uris]
+        self._cache.load_many(uris=uris)
+
+        return elements
+
+    def get_albums(self, uris: Sequence[URI | str]) -> list[Album]:
+        """
+        return loaded Album objects for the given uris using as few requests as possible
+
+        :param uris: uris of the albums
+        """
+        uris = [_process_uri(uri=uri) for uri in uris]
+        # hold the elements while they are loaded in case the cache only references them weakly
+        elements = [self._cache.get_album(uri=uri) for uri in uris]
+        self._cache.load_many(uris=uris)
+
+        return elements
+
+    def get_artists(self, uris: Sequence[URI | str]) -> list[Artist]:
+        """
+        return loaded Artist objects for the given uris using as few requests as possible
+
+        :param uris: uris of the artists
+        """
+        uris = [_process_uri(uri=uri) for uri in uris]
+        # hold the elements while they are loaded in case the cache only references them weakly
+        elements = [self._cache.get_artist(uri=uri) for uri in uris]
+        self._cache.load_many(uris=uris)
+
+        return elements
+
+    def get_episodes(self, uris: Sequence[URI | str]) -> list[Episode]:
+        """
+        return loaded Episode objects for the given uris using as few requests as possible
+
+        :param uris: uris of the episodes
+        """
+        uris = [_process_uri(uri=uri) for uri in uris]
+        # hold the elements while they are loaded in case the cache only references them weakly
+        elements = [self._cache.get_episode(uri=uri) for uri in uris]
+        self._cache.load_many(uris=uris)
+
+        return elements
+
+    def get_shows(self, uris: Sequence[URI | str]) -> list[Show]:
+        """
+        return loaded Show objects for the given uris using as few requests as possible
+
+        :param uris: uris of the shows
+        """
+        uris = [_process_uri(uri=uri) for uri in uris]
+        # hold the elements while they are loaded in case the cache only references them weakly
+        elements = [self._cache.get_show(uri=uri) for uri in uris]
+        self._cache.load_many(uris=uris)
+
+        return elements
+
     def search(
         self, query: str, element_type: str, limit: int = 5, offset: int = 0
     ) -> dict[
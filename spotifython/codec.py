@@ -0,0 +1,112 @@
+"""
+json encoding of api responses and cache files; uses orjson if it is installed (pip install spotifython[speed])
+
+Cache entries can be compressed with zlib or zstd; compressed entries are recognized by their header, so uncompressed
+entries stay readable.
+"""
+
+import json
+import zlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard
+    except ImportError:
+        zstd = None
+    else:
+        # same interface as the module of the standard library (python 3.14)
+        class zstd:
+            @staticmethod
+            def compress(data: bytes) -> bytes:
+                return zstandard.ZstdCompressor().compress(data)
+
+            @staticmethod
+            def decompress(data: bytes) -> bytes:
+                return zstandard.ZstdDecompressor().decompress(data)
+
+
+if orjson is not None:
+    name = "orjson"
+
+    def loads(data: bytes | str):
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+else:
+    name = "json"
+
+    def loads(data: bytes | str):
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf8")
+
+
+# orjson.JSONDecodeError is a subclass of this as well
+DecodeError = json.JSONDecodeError
+
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def check_compression(method: str | None):
+    """
+    :raises ImportError: if the library of the compression method is not installed
+    """
+    assert method in (None, ZLIB, ZSTD)
+    if method == ZSTD and zstd is None:
+        raise ImportError(
+            "zstandard is needed for zstd compression (pip install spotifython[zstd])"
+        )
+
+
+def compress(payload: bytes, method: str | None) -> bytes:
+    """
+    :param payload: encoded data
+    :param method: ZLIB, ZSTD or None to not compress
+    """
+    match method:
+        case None:
+            return payload
+        case "zlib":
+            return zlib.compress(payload)
+        case "zstd":
+            return zstd.compress(payload)
+    raise ValueError(f"unknown compression {method}")
+
+
+def decompress(payload: bytes) -> bytes:
+    """
+    :param payload: data written by :func:`compress` with any method
+    :raises ValueError: if the payload is corrupted or its compression is not available
+    """
+    if payload.startswith(_ZSTD_MAGIC):
+        if zstd is None:
+            raise ValueError("zstd compressed payload but zstandard is not installed")
+        try:
+            return zstd.decompress(payload)
+        except Exception as e:
+            raise ValueError("corrupted zstd payload") from e
+    # zlib header: deflate with a 32K window (0x78) and a check value making it a multiple of 31
+    if (
+        len(payload) >= 2
+        and payload[0] == 0x78
+        and int.from_bytes(payload[:2], "big") % 31 == 0
+    ):
+        try:
+            return zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError("corrupted zlib payload") from e
+    return payload
@@ -1,5 +1,10 @@
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import requests.adapters
 import base64
+import copy
+import threading
 import time
 import logging
 
@@ -14,16 +19,83 @@ from .errors import (
     InvalidTokenData,
     PayloadToLarge,
     HttpError,
+    SpotifyException,
 )
 from .authentication import Authentication
+from .ratelimit import RateLimiter
+from .metrics import Metrics
+from .singleflight import SingleFlight
+from . import codec
 from .scope import Scope
 
 log = logging.getLogger(__name__)
 
+API_URL = "https://api.spotify.com/v1/"
+
+
+def _text(content: bytes) -> str:
+    return content.decode("utf8", errors="replace")
+
 
 class Connection:
-    def __init__(self, authentication: Authentication):
+    """
+    :param authentication: Authentication object for client authentication
+    :param pool_size: maximum number of keep-alive connections held open per host
+    :param rate_limiter: RateLimiter shared by all requests of this connection (None to only respect Retry-After)
+    :param page_workers: maximum number of pages of one collection that are requested at the same time
+    :param refresh_margin: seconds before expiry at which the access token is refreshed
+    :param background_refresh: whether to refresh the access token on a timer instead of when a request needs it
+    :param metrics: Metrics to record the requests of this connection in (None to not record them)
+    """
+
+    def __init__(
+        self,
+        authentication: Authentication,
+        pool_size: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        page_workers: int = 8,
+        refresh_margin: float = 60.0,
+        background_refresh: bool = True,
+        metrics: Metrics | None = None,
+    ):
+        assert isinstance(pool_size, int) and pool_size > 0
+        assert isinstance(rate_limiter, (RateLimiter | None))
+        assert isinstance(page_workers, int) and page_workers > 0
+        assert isinstance(refresh_margin, (float | int))
+        assert isinstance(background_refresh, bool)
+        assert isinstance(metrics, (Metrics | None))
+
         self._authentication = authentication
+        self._page_workers = page_workers
+        self._refresh_margin = refresh_margin
+        self._background_refresh = background_refresh
+        self._token_lock = threading.Lock()
+        self._refresh_timer: threading.Timer | None = None
+        self._closed = False
+        self._flights = SingleFlight()
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._metrics = metrics if metrics is not None else Metrics()
+
+        # one session for the lifetime of the connection so tcp and tls handshakes are reused;
+        # the adapters pool is thread safe and the api does not rely on cookies
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self._session.mount("https://", adapter)
+
+        if self._authentication.token is not None:
+            self._schedule_refresh()
+
+    def close(self):
+        """
+        close all pooled connections and stop refreshing the access token
+        """
+        with self._token_lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+        self._session.close()
 
     def _get_header(self) -> dict:
         return {
@@ -32,8 +104,15 @@ class Connection:
             "Authorization": "Bearer " + self._authentication.token,
         }
 
-    def _evaluate_response(self, response: requests.Response) -> dict | None:
-        match response.status_code:
+    def _evaluate_response(
+        self, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> dict | None:
+        """
+        check the status of a response and decode its content; shared by the blocking and the asyncio connection
+
+        :raises Retry: if the request should be repeated (after waiting for Retry.delay seconds)
+        """
+        match status_code:
             case 202:
                 # Accepted (seems to imply success and 204)
                 return None
@@ -41,70 +120,188 @@ class Connection:
                 # no content
                 return None
             case 304:
-                raise NotModified(response.text)
+                raise NotModified(_text(content))
             case 400:
-                raise BadRequestException(response.text)
+                raise BadRequestException(_text(content))
             case 401:
                 if self.is_expired:
-                    self._get_token()
-                    raise Retry()
-                raise InvalidTokenException(response.text)
+                    raise Retry(refresh_token=True)
+                raise InvalidTokenException(_text(content))
             case 403:
-                raise ForbiddenException(response.text)
+                raise ForbiddenException(_text(content))
             case 404:
-                raise NotFoundException(response.text)
+                raise NotFoundException(_text(content))
             case 413:
-                raise PayloadToLarge(response.text)
+                raise PayloadToLarge(_text(content))
             case 429:
-                # rate limit
-                log.warning("rate limit exceeded; will retry in 5 seconds")
-                time.sleep(5)
+                # rate limit; pause every caller until the api accepts requests again
+                try:
+                    retry_after = float(headers["Retry-After"])
+                except (KeyError, ValueError):
+                    retry_after = 5.0
+                self._rate_limiter.block(retry_after)
                 raise Retry()
             case 500:
-                raise InternalServerError(response.text)
+                raise InternalServerError(_text(content))
             case 503:
                 # service unavailable
                 log.warning("service unavailable; will retry in 1 second")
-                time.sleep(1)
-                raise Retry()
+                raise Retry(delay=1)
             case x:
                 if x >= 300:
-                    raise HttpError((x, response.text))
+                    raise HttpError((x, _text(content)))
                 if x < 200:
-                    time.sleep(1)
-                    raise Retry()
+                    raise Retry(delay=1)
 
         try:
-            return response.json()
-        except requests.JSONDecodeError:
+            return codec.loads(content)
+        except ValueError:
             return None
 
-    def make_request(
-        self, method: str, endpoint: str, request_data: str | None = None
-    ) -> dict | None:
-        url = "https://api.spotify.com/v1/" + endpoint
-        if self._authentication.token is None:
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        request_data: str | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> tuple[dict | None, Mapping[str, str]]:
+        if method != "GET":
+            return self._send_request(method, endpoint, request_data, extra_headers)
+
+        # identical reads that are in flight at the same time share one response
+        key = (endpoint, tuple(sorted((extra_headers or {}).items())))
+        return self._flights.do(
+            key,
+            lambda: self._send_request(method, endpoint, request_data, extra_headers),
+            copy=copy.deepcopy,
+        )
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        request_data: str | None,
+        extra_headers: dict[str, str] | None,
+    ) -> tuple[dict | None, Mapping[str, str]]:
+        url = API_URL + endpoint
+        if self._authentication.token is None or self._token_expires_soon():
             self._get_token()
         if request_data is not None:
             log.debug("%s %s with %s", method, url, request_data)
 
+        metrics = self._metrics
         retries = 5
         while retries > 0:
-            response = requests.request(
-                method, url, data=request_data, headers=self._get_header()
+            waited = self._rate_limiter.acquire()
+            headers = self._get_header()
+            if extra_headers is not None:
+                headers.update(extra_headers)
+            # read once, since metrics may be switched on or off while the request runs
+            recording = metrics.enabled
+            if recording:
+                metrics.record_rate_limit_wait(waited)
+                metrics.before_request(method, endpoint)
+                start = time.perf_counter()
+            response = self._session.request(
+                method, url, data=request_data, headers=headers
             )
+            if recording:
+                metrics.after_response(
+                    method,
+                    endpoint,
+                    response.status_code,
+                    time.perf_counter() - start,
+                    len(response.content),
+                )
             try:
-                data = self._evaluate_response(response)
-            except Retry:
+                data = self._evaluate_response(
+                    response.status_code, response.headers, response.content
+                )
+            except Retry as retry:
                 retries -= 1
                 log.info("retrying (%d)", retries)
+                if recording:
+                    metrics.record_retry(retry.delay)
+                if retry.refresh_token:
+                    self._get_token()
+                if retry.delay > 0:
+                    time.sleep(retry.delay)
             else:
-                break
-        else:
-            log.error("request ran out of retries")
-            data = None
+                return data, response.headers
+
+        log.error("request ran out of retries")
+        return None, {}
+
+    def make_request(
+        self, method: str, endpoint: str, request_data: str | None = None
+    ) -> dict | None:
+        data, _ = self._send(method, endpoint, request_data=request_data)
         return data
 
+    def make_conditional_request(
+        self, endpoint: str, etag: str | None = None
+    ) -> tuple[dict | None, str | None]:
+        """
+        GET request that only transfers the resource if it does not match etag anymore
+
+        :param endpoint: endpoint to request
+        :param etag: ETag of the cached version of the resource (None to request unconditionally)
+        :return: data and ETag of the response
+        :raises NotModified: if the resource still matches etag
+        """
+        data, headers = self._send(
+            "GET",
+            endpoint,
+            extra_headers={"If-None-Match": etag} if etag is not None else None,
+        )
+        return data, headers.get("ETag")
+
+    def _get_page(self, endpoint: str, offset: int, limit: int, **params) -> dict:
+        endpoint = self.add_parameters_to_endpoint(
+            endpoint, offset=offset, limit=limit, **params
+        )
+        if (response := self.make_request("GET", endpoint)) is None:
+            raise SpotifyException("api request got no data")
+        return response
+
+    def get_remaining_items(
+        self, endpoint: str, first_page: dict, limit: int, **params
+    ) -> list:
+        """
+        request the items of a paged collection that are not part of its first page
+
+        :param endpoint: endpoint of the collection without paging parameters
+        :param first_page: the already requested page at offset 0
+        :param limit: number of items per page
+        :param params: additional query parameters
+        :return: the items in the order of the collection
+        """
+        if first_page.get("next") is None:
+            return []
+
+        items = []
+        if first_page.get("total") is None:
+            # without the total the pages have to be followed one after another
+            offset = limit
+            while True:
+                page = self._get_page(endpoint, offset, limit, **params)
+                items += page["items"]
+                if page.get("next") is None:
+                    return items
+                offset += limit
+
+        offsets = range(limit, first_page["total"], limit)
+        with ThreadPoolExecutor(
+            max_workers=min(self._page_workers, len(offsets))
+        ) as executor:
+            pages = executor.map(
+                lambda offset: self._get_page(endpoint, offset, limit, **params),
+                offsets,
+            )
+            for page in pages:
+                items += page["items"]
+        return items
+
     @staticmethod
     def add_parameters_to_endpoint(endpoint: str, **params) -> str:
         param_strings = []
@@ -213,7 +410,7 @@ class Connection:
             "Authorization": "Basic " + encoded,
         }
 
-        response = requests.post(
+        response = self._session.post(
             "https://accounts.spotify.com/api/token", data=form, headers=header
         )
         data = response.json()
@@ -261,7 +458,7 @@ class Connection:
             "Authorization": "Basic " + encoded,
         }
 
-        response = requests.post(
+        response = self._session.post(
             "https://accounts.spotify.com/api/token", data=form, headers=header
         )
         data = response.json()
@@ -280,12 +477,54 @@ class Connection:
         self._authentication.scope = data["scope"]
 
     def _get_token(self):
-        if self._authentication.refresh_token is not None:
-            log.info("refreshing access token")
-            self._refresh_access_token()
-        else:
-            log.info("requesting access and refresh token")
-            self._request_token()
+        with self._token_lock:
+            # another thread may have gotten a new token while this one waited
+            if (
+                self._authentication.token is not None
+                and not self._token_expires_soon()
+                and not self.is_expired
+            ):
+                return
+
+            if self._authentication.refresh_token is not None:
+                log.info("refreshing access token")
+                self._refresh_access_token()
+            else:
+                log.info("requesting access and refresh token")
+                self._request_token()
+        self._schedule_refresh()
+
+    def _token_expires_soon(self) -> bool:
+        """
+        whether the token should be refreshed before the next request (only possible with a refresh token)
+        """
+        if self._authentication.refresh_token is None:
+            return False
+        return self._authentication.token_expires - self._refresh_margin < time.time()
+
+    def _schedule_refresh(self):
+        if not self._background_refresh or self._authentication.refresh_token is None:
+            return
+
+        delay = max(
+            0.0,
+            self._authentication.token_expires - self._refresh_margin - time.time(),
+        )
+        with self._token_lock:
+            if self._closed:
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = threading.Timer(delay, self._refresh_in_background)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _refresh_in_background(self):
+        try:
+            self._get_token()
+        except Exception:
+            # the next request refreshes the token itself
+            log.exception("refreshing the access token in the background failed")
 
     def dump_token_data(self) -> dict:
         return {
@@ -5,6 +5,7 @@ from .abc import Playable
 from .uri import URI
 from .cache import Cache
 from .connection import Connection
+from .async_connection import AsyncConnection
 
 
 class Episode(Playable):
@@ -33,6 +34,8 @@ class Episode(Playable):
                 ret["images"] = self._images
             if self._show is not None:
                 ret["show"] = self._show.to_dict(minimal=True)
+            if self._requested_time is not None:
+                ret["requested_time"] = self._requested_time
         return ret
 
     @staticmethod
@@ -48,18 +51,50 @@ class Episode(Playable):
             return response
         raise SpotifyException("api request got no data")
 
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "episodes/{id}".format(id=uri.id), fields="uri,name,images,show(uri,name)"
+        )
+        response = await connection.make_request("GET", endpoint)
+        if response is not None:
+            return response
+        raise SpotifyException("api request got no data")
+
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None]:
+        assert isinstance(connection, Connection)
+
+        ret = []
+        for i in range(0, len(uris), 50):
+            endpoint = connection.add_parameters_to_endpoint(
+                "episodes", ids=",".join(uri.id for uri in uris[i : i + 50])
+            )
+            if (response := connection.make_request("GET", endpoint)) is None:
+                raise SpotifyException("api request got no data")
+            ret += response["episodes"]
+        return ret
+
     def load_dict(self, data: dict):
         assert isinstance(data, dict)
         assert str(self._uri) == data["uri"]
 
         self._name = data["name"]
+        self._requested_time = data.get("requested_time")
         self._images = data["images"]
         self._show = self._cache.get_show(
             uri=URI(data["show"]["uri"]), name=data["show"]["name"]
         )
 
-    def is_expired(self) -> bool:
-        return False
+    def _unload(self):
+        self._images = None
+        self._show = None
+        self._requested_time = None
 
     @property
     def images(self) -> list[dict[str, str | int | None]]:
@@ -68,18 +103,20 @@ class Episode(Playable):
 
         :return: [{'height': (int | None), 'width': (int | None), 'url': str}]
         """
-        if self._images is None:
-            self._cache.load(uri=self._uri)
-        if self._images is not None:
-            return self._images.copy()
+        images = self._images
+        while images is None and self._cache.load(uri=self._uri):
+            images = self._images
+        if images is not None:
+            return images.copy()
         raise Exception("unreachable")
 
     @property
     def show(self) -> Show:
-        if self._show is None:
-            self._cache.load(uri=self._uri)
-        if self._show is not None:
-            return self._show
+        show = self._show
+        while show is None and self._cache.load(uri=self._uri):
+            show = self._show
+        if show is not None:
+            return show
         raise Exception("unreachable")
 
     @staticmethod
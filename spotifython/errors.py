@@ -57,7 +57,10 @@ class InvalidTokenData(SpotifyException):
 
 
 class Retry(Exception):
-    pass
+    def __init__(self, delay: float = 0.0, refresh_token: bool = False):
+        super().__init__()
+        self.delay = delay
+        self.refresh_token = refresh_token
 
 
 class ElementOutdated(Exception):
@@ -45,11 +45,10 @@ class SavedTracks(PlayContext):
 
         base = {}
         # get saved tracks
-        offset = 0
         limit = 50
-        fields = "next,items(added_at,track(uri,name))"
+        fields = "next,total,items(added_at,track(uri,name))"
         endpoint = connection.add_parameters_to_endpoint(
-            "me/tracks", offset=offset, limit=limit, fields=fields
+            "me/tracks", offset=0, limit=limit, fields=fields
         )
 
         if (response := connection.make_request("GET", endpoint)) is not None:
@@ -57,22 +56,37 @@ class SavedTracks(PlayContext):
         else:
             raise SpotifyException("api request got no data")
 
-        offset += limit
         # check for long data that needs paging
-        if data["next"] is not None:
-            while True:
-                endpoint = connection.add_parameters_to_endpoint(
-                    "me/tracks", offset=offset, limit=limit, fields=fields
-                )
-                offset += limit
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["items"] += extra_data["items"]
-
-                if extra_data["next"] is None:
-                    break
+        data["items"] += connection.get_remaining_items(
+            "me/tracks", first_page=data, limit=limit, fields=fields
+        )
+        base["tracks"] = data
+        base["requested_time"] = time.time()
+
+        return base
+
+    @staticmethod
+    async def make_request_async(uri: URI | None, connection: AsyncConnection) -> dict:
+        del uri
+        assert isinstance(connection, AsyncConnection)
+
+        base = {}
+        # get saved tracks
+        limit = 50
+        fields = "next,total,items(added_at,track(uri,name))"
+        endpoint = connection.add_parameters_to_endpoint(
+            "me/tracks", offset=0, limit=limit, fields=fields
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["items"] += await connection.get_remaining_items(
+            "me/tracks", first_page=data, limit=limit, fields=fields
+        )
         base["tracks"] = data
         base["requested_time"] = time.time()
 
@@ -81,9 +95,9 @@ class SavedTracks(PlayContext):
     def load_dict(self, data: dict):
         assert isinstance(data, dict)
 
-        self._items = []
+        items = []
         for item in data["tracks"]["items"]:
-            self._items.append(
+            items.append(
                 {
                     "track": self._cache.get_track(
                         uri=URI(item["track"]["uri"]), name=item["track"]["name"]
@@ -92,15 +106,11 @@ class SavedTracks(PlayContext):
                 }
             )
         self._requested_time = data["requested_time"]
+        self._items = items
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self.uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24 * 7
-            )  # one week in unix time
-        raise Exception("unreachable")
+    def _unload(self):
+        self._items = None
+        self._requested_time = None
 
     @property
     def uri(self) -> URI:
@@ -156,10 +166,9 @@ class Me(User):
             raise SpotifyException("api request got no data")
 
         # get saved albums
-        offset = 0
         limit = 50
         endpoint = connection.add_parameters_to_endpoint(
-            "me/albums", offset=offset, limit=limit, fields="items(album(uri,name))"
+            "me/albums", offset=0, limit=limit, fields="items(album(uri,name))"
         )
 
         if (response := connection.make_request("GET", endpoint)) is not None:
@@ -168,31 +177,30 @@ class Me(User):
             raise SpotifyException("api request got no data")
 
         # check for long data that needs paging
-        if "next" in data and data["next"] is not None:
-            while True:
-                endpoint = connection.add_parameters_to_endpoint(
-                    "me/albums",
-                    offset=offset,
-                    limit=limit,
-                    fields="items(album(uri,name))",
-                )
-                offset += limit
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["items"] += extra_data["items"]
-
-                if "next" in extra_data and extra_data["next"] is None:
-                    break
+        data["items"] += connection.get_remaining_items(
+            "me/albums", first_page=data, limit=limit, fields="items(album(uri,name))"
+        )
         base["albums"] = data
 
-        # get saved playlists
-        offset = 0
+        base["playlists"] = Me.make_playlists_request(connection=connection)
+
+        base["requested_time"] = time.time()
+
+        return base
+
+    @staticmethod
+    def make_playlists_request(connection: Connection) -> dict:
+        """
+        request the uri, name and snapshot id of the saved playlists
+
+        :return: {"items": [{"uri": uri, "name": name, "snapshot_id": snapshot_id}, ...]}
+        """
+        assert isinstance(connection, Connection)
+
         limit = 50
         endpoint = connection.add_parameters_to_endpoint(
             "me/playlists",
-            offset=offset,
+            offset=0,
             limit=limit,
             fields="items(uri,name,snapshot_id)",
         )
@@ -203,24 +211,74 @@ class Me(User):
             raise SpotifyException("api request got no data")
 
         # check for long data that needs paging
-        if "next" in data and data["next"] is not None:
-            while True:
-                endpoint = connection.add_parameters_to_endpoint(
-                    "me/playlists",
-                    offset=offset,
-                    limit=limit,
-                    fields="items(uri,name,snapshot_id)",
-                )
-                offset += limit
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["items"] += extra_data["items"]
+        data["items"] += connection.get_remaining_items(
+            "me/playlists",
+            first_page=data,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
+        return data
 
-                if "next" in extra_data and extra_data["next"] is None:
-                    break
-        base["playlists"] = data
+    @staticmethod
+    async def make_playlists_request_async(connection: AsyncConnection) -> dict:
+        """
+        same as :meth:`make_playlists_request` but through the given asyncio connection
+        """
+        assert isinstance(connection, AsyncConnection)
+
+        limit = 50
+        endpoint = connection.add_parameters_to_endpoint(
+            "me/playlists",
+            offset=0,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["items"] += await connection.get_remaining_items(
+            "me/playlists",
+            first_page=data,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
+        return data
+
+    @staticmethod
+    async def make_request_async(uri: URI | None, connection: AsyncConnection) -> dict:
+        del uri
+        assert isinstance(connection, AsyncConnection)
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "me", fields="display_name,uri"
+        )
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            base = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # get saved albums
+        limit = 50
+        endpoint = connection.add_parameters_to_endpoint(
+            "me/albums", offset=0, limit=limit, fields="items(album(uri,name))"
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["items"] += await connection.get_remaining_items(
+            "me/albums", first_page=data, limit=limit, fields="items(album(uri,name))"
+        )
+        base["albums"] = data
+
+        base["playlists"] = await Me.make_playlists_request_async(connection=connection)
 
         base["requested_time"] = time.time()
 
@@ -232,21 +290,21 @@ class Me(User):
         self._uri = URI(data["uri"])
         self._name = data["display_name"]
 
-        self._albums = []
+        albums = []
         for album in data["albums"]["items"]:
             if album == {}:
                 continue
-            self._albums.append(
+            albums.append(
                 self._cache.get_album(
                     uri=URI(album["album"]["uri"]),
                     name=album["album"]["name"],
                 )
             )
-        self._playlists = []
+        playlists = []
         for playlist in data["playlists"]["items"]:
             if playlist == {}:
                 continue
-            self._playlists.append(
+            playlists.append(
                 self._cache.get_playlist(
                     uri=URI(playlist["uri"]),
                     name=playlist["name"],
@@ -254,6 +312,8 @@ class Me(User):
                 )
             )
         self._requested_time = data["requested_time"]
+        self._albums = albums
+        self._playlists = playlists
 
     def to_dict(self, minimal: bool = False) -> dict:
         ret = super().to_dict(minimal=minimal)
@@ -266,14 +326,9 @@ class Me(User):
             }
         return ret
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self.uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24
-            )  # one day in unix time
-        raise Exception("unreachable")
+    def _unload(self):
+        super()._unload()
+        self._albums = None
 
     @property
     def uri(self) -> URI:
@@ -323,6 +378,7 @@ class Me(User):
 from .cache import Cache
 from .uri import URI
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .track import Track
 from .playlist import Playlist
 from .album import Album
@@ -0,0 +1,141 @@
+from collections.abc import Callable
+import bisect
+import threading
+
+# path segments following these are ids and get replaced in endpoint templates
+_COLLECTIONS = {
+    "albums",
+    "artists",
+    "episodes",
+    "playlists",
+    "shows",
+    "tracks",
+    "users",
+}
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    reduce an endpoint to its template (e.g. "playlists/{id}/tracks") so requests for different elements are grouped
+    """
+    parts = endpoint.split("?", 1)[0].split("/")
+    for i in range(1, len(parts)):
+        if parts[i - 1] in _COLLECTIONS:
+            parts[i] = "{id}"
+    return "/".join(parts)
+
+
+class Metrics:
+    """
+    Request statistics of a :class:`Client`. Nothing is recorded and no hooks are called while disabled.
+
+    :param enabled: whether to collect statistics
+    """
+
+    #: upper bounds in seconds of the latency histogram buckets
+    buckets: tuple[float, ...] = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, enabled: bool = False):
+        assert isinstance(enabled, bool)
+
+        self.enabled: bool = enabled
+        self._lock = threading.Lock()
+        self._pre_request_hooks: list[Callable[[str, str], None]] = []
+        self._post_response_hooks: list[Callable[[str, str, int, float], None]] = []
+        self.reset()
+
+    def reset(self):
+        """
+        clear all recorded statistics
+        """
+        with self._lock:
+            self._latencies: dict[str, list[int]] = {}
+            self._latency_sums: dict[str, float] = {}
+            self._status_codes: dict[int, int] = {}
+            self._retries: int = 0
+            self._rate_limit_sleep: float = 0.0
+            self._retry_sleep: float = 0.0
+            self._bytes_received: int = 0
+
+    def add_pre_request_hook(self, hook: Callable[[str, str], None]):
+        """
+        call hook(method, endpoint) before every request is sent
+
+        :param hook: function to call; exceptions propagate to the request
+        """
+        self._pre_request_hooks.append(hook)
+
+    def add_post_response_hook(self, hook: Callable[[str, str, int, float], None]):
+        """
+        call hook(method, endpoint, status_code, seconds) after every response is received
+
+        :param hook: function to call; exceptions propagate to the request
+        """
+        self._post_response_hooks.append(hook)
+
+    def before_request(self, method: str, endpoint: str):
+        for hook in self._pre_request_hooks:
+            hook(method, endpoint)
+
+    def after_response(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        seconds: float,
+        size: int,
+    ):
+        template = endpoint_template(endpoint)
+        with self._lock:
+            if (histogram := self._latencies.get(template)) is None:
+                histogram = self._latencies[template] = [0] * (len(self.buckets) + 1)
+                self._latency_sums[template] = 0.0
+            histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._latency_sums[template] += seconds
+            self._status_codes[status_code] = self._status_codes.get(status_code, 0) + 1
+            self._bytes_received += size
+
+        for hook in self._post_response_hooks:
+            hook(method, endpoint, status_code, seconds)
+
+    def record_retry(self, seconds: float):
+        """
+        :param seconds: time slept before retrying
+        """
+        with self._lock:
+            self._retries += 1
+            self._retry_sleep += seconds
+
+    def record_rate_limit_wait(self, seconds: float):
+        with self._lock:
+            self._rate_limit_sleep += seconds
+
+    def snapshot(self) -> dict:
+        """
+        get a copy of the recorded statistics
+
+        :return: {"endpoints": {template: {"count": int, "seconds": float, "buckets": {upper_bound: int}}}, "status_codes": {int: int}, "retries": int, "retry_sleep_seconds": float, "rate_limit_sleep_seconds": float, "bytes_received": int}
+        """
+        with self._lock:
+            endpoints = {}
+            for template, histogram in self._latencies.items():
+                bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(bounds, histogram):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                endpoints[template] = {
+                    "count": cumulative,
+                    "seconds": self._latency_sums[template],
+                    "buckets": buckets,
+                }
+
+            return {
+                "endpoints": endpoints,
+                "status_codes": self._status_codes.copy(),
+                "retries": self._retries,
+                "retry_sleep_seconds": self._retry_sleep,
+                "rate_limit_sleep_seconds": self._rate_limit_sleep,
+                "bytes_received": self._bytes_received,
+            }
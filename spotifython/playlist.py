@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .user import User
 from .cache import Cache
 from .uri import URI
@@ -34,6 +35,7 @@ class Playlist(PlayContext):
         self._items: list[dict[str, Track | Episode]] | None = None
         self._images: list[dict[str, str | int | None]] | None = None
         self._requested_time: float | None = None
+        self._etag: str | None = None
 
     def to_dict(self, minimal: bool = False) -> dict:
         ret = {"uri": str(self._uri)}
@@ -61,6 +63,8 @@ class Playlist(PlayContext):
                 ret["owner"] = self._owner.to_dict(minimal=True)
             if self._requested_time is not None:
                 ret["requested_time"] = self._requested_time
+            if self._etag is not None:
+                ret["etag"] = self._etag
 
             if self._items is not None:
                 ret["tracks"] = {
@@ -75,43 +79,76 @@ class Playlist(PlayContext):
         return ret
 
     @staticmethod
-    def make_request(uri: URI, connection: Connection) -> dict:
+    def make_request(uri: URI, connection: Connection, etag: str | None = None) -> dict:
+        """
+        :param etag: ETag of the cached data; raises NotModified if the playlist did not change since
+        """
         assert isinstance(uri, URI)
         assert isinstance(connection, Connection)
         assert uri.type == Playlist
 
-        offset = 0
         limit = 100
         endpoint = connection.add_parameters_to_endpoint(
             "playlists/{playlist_id}".format(playlist_id=uri.id),
-            fields="uri,description,name,images,owner(uri,display_name),snapshot_id,public,tracks(next,items(added_at,track(name,uri,is_local)))",
-            offset=offset,
+            fields="uri,description,name,images,owner(uri,display_name),snapshot_id,public,tracks(next,total,items(added_at,track(name,uri,is_local)))",
+            offset=0,
             limit=limit,
         )
 
-        if (response := connection.make_request("GET", endpoint)) is not None:
+        response, response_etag = connection.make_conditional_request(endpoint, etag)
+        if response is not None:
             data = response
         else:
             raise SpotifyException("api request got no data")
+        data["etag"] = response_etag
 
         # check for long data that needs paging
-        if data["tracks"]["next"] is not None:
-            while True:
-                offset += limit
-                endpoint = connection.add_parameters_to_endpoint(
-                    "playlists/{playlist_id}/tracks".format(playlist_id=uri.id),
-                    fields="next,items(added_at,track(name,uri,is_local))",
-                    offset=offset,
-                    limit=limit,
-                )
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["tracks"]["items"] += extra_data["items"]
-
-                if extra_data["next"] is None:
-                    break
+        data["tracks"]["items"] += connection.get_remaining_items(
+            "playlists/{playlist_id}/tracks".format(playlist_id=uri.id),
+            first_page=data["tracks"],
+            limit=limit,
+            fields="next,items(added_at,track(name,uri,is_local))",
+        )
+
+        data["requested_time"] = time.time()
+
+        return data
+
+    @staticmethod
+    async def make_request_async(
+        uri: URI, connection: AsyncConnection, etag: str | None = None
+    ) -> dict:
+        """
+        :param etag: ETag of the cached data; raises NotModified if the playlist did not change since
+        """
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+        assert uri.type == Playlist
+
+        limit = 100
+        endpoint = connection.add_parameters_to_endpoint(
+            "playlists/{playlist_id}".format(playlist_id=uri.id),
+            fields="uri,description,name,images,owner(uri,display_name),snapshot_id,public,tracks(next,total,items(added_at,track(name,uri,is_local)))",
+            offset=0,
+            limit=limit,
+        )
+
+        response, response_etag = await connection.make_conditional_request(
+            endpoint, etag
+        )
+        if response is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+        data["etag"] = response_etag
+
+        # check for long data that needs paging
+        data["tracks"]["items"] += await connection.get_remaining_items(
+            "playlists/{playlist_id}/tracks".format(playlist_id=uri.id),
+            first_page=data["tracks"],
+            limit=limit,
+            fields="next,items(added_at,track(name,uri,is_local))",
+        )
 
         data["requested_time"] = time.time()
 
@@ -121,15 +158,17 @@ class Playlist(PlayContext):
         assert isinstance(data, dict)
         assert str(self._uri) == data["uri"]
 
-        self._requested_time = data["requested_time"]
-        if (not data["fetched"]) and (
-            self._snapshot_id is not None
+        if (
+            not data["fetched"]
+            and self._snapshot_id is not None
             and self._snapshot_id != data["snapshot_id"]
-            or self.is_expired()
         ):
             raise ElementOutdated()
 
+        self._requested_time = data["requested_time"]
+
         self._name = data["name"]
+        self._etag = data.get("etag")
         self._snapshot_id = data["snapshot_id"]
         self._description = data["description"]
         self._public = data["public"]
@@ -137,11 +176,11 @@ class Playlist(PlayContext):
             uri=URI(data["owner"]["uri"]), display_name=data["owner"]["display_name"]
         )
         self._images = data["images"]
-        self._items = []
+        items = []
         for track_to_add in data["tracks"]["items"]:
             if track_to_add["track"] is None or track_to_add["track"].get("is_local"):
                 continue
-            self._items.append(
+            items.append(
                 {
                     "track": self._cache.get_element(
                         uri=URI(track_to_add["track"]["uri"]),
@@ -150,54 +189,60 @@ class Playlist(PlayContext):
                     "added_at": track_to_add["added_at"],
                 }
             )
+        self._items = items
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self._uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24 * 7
-            )  # one week in unix time
-        raise Exception("unreachable")
+    def _unload(self):
+        self._description = None
+        self._owner = None
+        self._public = None
+        self._items = None
+        self._images = None
+        self._requested_time = None
+        self._etag = None
 
     @property
     def description(self) -> str:
-        if self._description is None:
-            self._cache.load(uri=self._uri)
-        if self._description is not None:
-            return self._description
+        description = self._description
+        while description is None and self._cache.load(uri=self._uri):
+            description = self._description
+        if description is not None:
+            return description
         raise Exception("unreachable")
 
     @property
     def owner(self) -> User:
-        if self._owner is None:
-            self._cache.load(uri=self._uri)
-        if self._owner is not None:
-            return self._owner
+        owner = self._owner
+        while owner is None and self._cache.load(uri=self._uri):
+            owner = self._owner
+        if owner is not None:
+            return owner
         raise Exception("unreachable")
 
     @property
     def snapshot_id(self) -> str:
-        if self._snapshot_id is None:
-            self._cache.load(uri=self._uri)
-        if self._snapshot_id is not None:
-            return self._snapshot_id
+        snapshot_id = self._snapshot_id
+        while snapshot_id is None and self._cache.load(uri=self._uri):
+            snapshot_id = self._snapshot_id
+        if snapshot_id is not None:
+            return snapshot_id
         raise Exception("unreachable")
 
     @property
     def public(self) -> bool:
-        if self._public is None:
-            self._cache.load(uri=self._uri)
-        if self._public is not None:
-            return self._public
+        public = self._public
+        while public is None and self._cache.load(uri=self._uri):
+            public = self._public
+        if public is not None:
+            return public
         raise Exception("unreachable")
 
     @property
     def items(self) -> list[Track | Episode]:
-        if self._items is None:
-            self._cache.load(uri=self._uri)
-        if self._items is not None:
-            return [item["track"] for item in self._items]
+        items = self._items
+        while items is None and self._cache.load(uri=self._uri):
+            items = self._items
+        if items is not None:
+            return [item["track"] for item in items]
         raise Exception("unreachable")
 
     @property
@@ -207,10 +252,11 @@ class Playlist(PlayContext):
 
         :return: [{'height': (int | None), 'width': (int | None), 'url': str}]
         """
-        if self._images is None:
-            self._cache.load(uri=self._uri)
-        if self._images is not None:
-            return self._images.copy()
+        images = self._images
+        while images is None and self._cache.load(uri=self._uri):
+            images = self._images
+        if images is not None:
+            return images.copy()
         raise Exception("unreachable")
 
     def search(self, *strings: str) -> list[Playable]:
@@ -220,12 +266,10 @@ class Playlist(PlayContext):
         :param strings: strings to search for
         :return: list of Tracks and Episodes
         """
-        if self._items is None:
-            self._cache.load(uri=self._uri)
         results = []
         strings = [string.lower() for string in strings]
-        for item in self._items:
-            song_title = item["track"].name.lower()
+        for track in self.items:
+            song_title = track.name.lower()
 
             do_append = True
             for string in strings:
@@ -235,7 +279,7 @@ class Playlist(PlayContext):
                     break
 
             if do_append:
-                results.append(item["track"])
+                results.append(track)
 
         return results
 
@@ -0,0 +1,78 @@
+import threading
+import time
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket that paces requests before they are sent. One instance is shared by every caller of a
+    :class:`Connection`, so a rate limit response from the api pauses all threads instead of only the one that hit it.
+
+    :param rate: number of requests per second to allow on average (None to only respect Retry-After)
+    :param burst: number of requests that may be sent at once after being idle
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 10):
+        assert isinstance(rate, (float | int | None))
+        assert rate is None or rate > 0
+        assert isinstance(burst, int) and burst > 0
+
+        self._rate: float | None = rate
+        self._burst: int = burst
+        self._tokens: float = float(burst)
+        self._last_refill: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if self._rate is None:
+            return
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def try_acquire(self) -> float:
+        """
+        take a token if one is available without waiting
+
+        :return: 0 if the request may be sent, else the number of seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._blocked_until > now:
+                return self._blocked_until - now
+            if self._rate is None:
+                return 0.0
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self) -> float:
+        """
+        block until a request may be sent
+
+        :return: seconds spent waiting
+        """
+        waited = 0.0
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    def block(self, seconds: float):
+        """
+        stop handing out tokens for the given time (e.g. after the api answered with Retry-After)
+
+        :param seconds: time to wait before the next request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._last_refill = now
+        log.warning("rate limit exceeded; pausing requests for %.1f seconds", seconds)
@@ -6,6 +6,7 @@ from .abc import PlayContext
 from .uri import URI
 from .cache import Cache
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .episode import Episode
 
 
@@ -41,7 +42,7 @@ class Show(PlayContext):
                 ret["requested_time"] = self._requested_time
 
             if self._items is not None:
-                ret["albums"] = {
+                ret["episodes"] = {
                     "items": [item.to_dict(minimal=True) for item in self._items]
                 }
         return ret
@@ -52,10 +53,9 @@ class Show(PlayContext):
         assert isinstance(connection, Connection)
         assert uri.type == Show
 
-        offset = 0
         limit = 50
         endpoint = connection.add_parameters_to_endpoint(
-            "albums/{id}".format(id=uri.id), offset=offset, limit=limit
+            "shows/{id}".format(id=uri.id), offset=0, limit=limit
         )
 
         if (response := connection.make_request("GET", endpoint)) is not None:
@@ -64,25 +64,78 @@ class Show(PlayContext):
             raise SpotifyException("api request got no data")
 
         # check for long data that needs paging
-        if data["albums"]["next"] is not None:
-            while True:
-                offset += limit
-                endpoint = connection.add_parameters_to_endpoint(
-                    "albums/{id}/albums".format(id=uri.id), offset=offset, limit=limit
-                )
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["albums"]["items"] += extra_data["items"]
-
-                if extra_data["next"] is None:
-                    break
+        data["episodes"]["items"] += connection.get_remaining_items(
+            "shows/{id}/episodes".format(id=uri.id),
+            first_page=data["episodes"],
+            limit=limit,
+        )
+
+        data["requested_time"] = time.time()
+
+        return data
+
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+        assert uri.type == Show
+
+        limit = 50
+        endpoint = connection.add_parameters_to_endpoint(
+            "shows/{id}".format(id=uri.id), offset=0, limit=limit
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["episodes"]["items"] += await connection.get_remaining_items(
+            "shows/{id}/episodes".format(id=uri.id),
+            first_page=data["episodes"],
+            limit=limit,
+        )
 
         data["requested_time"] = time.time()
 
         return data
 
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None]:
+        assert isinstance(connection, Connection)
+
+        limit = 50
+        ret = []
+        for i in range(0, len(uris), 50):
+            endpoint = connection.add_parameters_to_endpoint(
+                "shows", ids=",".join(uri.id for uri in uris[i : i + 50])
+            )
+            if (response := connection.make_request("GET", endpoint)) is None:
+                raise SpotifyException("api request got no data")
+
+            for data in response["shows"]:
+                # the batch endpoint does not include the episodes
+                if data is not None:
+                    endpoint = connection.add_parameters_to_endpoint(
+                        "shows/{id}/episodes".format(id=data["id"]),
+                        offset=0,
+                        limit=limit,
+                    )
+                    if (episodes := connection.make_request("GET", endpoint)) is None:
+                        raise SpotifyException("api request got no data")
+                    episodes["items"] += connection.get_remaining_items(
+                        "shows/{id}/episodes".format(id=data["id"]),
+                        first_page=episodes,
+                        limit=limit,
+                    )
+                    data["episodes"] = episodes
+                    data["requested_time"] = time.time()
+                ret.append(data)
+        return ret
+
     def load_dict(self, data: dict):
         assert isinstance(data, dict)
         assert str(self._uri) == data["uri"]
@@ -91,38 +144,38 @@ class Show(PlayContext):
         self._name = data["name"]
         self._images = data["images"]
         self._description = data["description"]
-        self._items = []
+        items = []
 
-        for episode in data["albums"]["items"]:
+        for episode in data["episodes"]["items"]:
             if episode is None:
                 continue
-            self._items.append(
+            items.append(
                 self._cache.get_episode(uri=URI(episode["uri"]), name=episode["name"])
             )
+        self._items = items
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self._uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24 * 7
-            )  # one week in unix time
-        raise Exception("unreachable")
+    def _unload(self):
+        self._items = None
+        self._images = None
+        self._description = None
+        self._requested_time = None
 
     @property
     def episodes(self) -> list[Episode]:
-        if self._items is None:
-            self._cache.load(uri=self._uri)
-        if self._items is not None:
-            return self._items.copy()
+        items = self._items
+        while items is None and self._cache.load(uri=self._uri):
+            items = self._items
+        if items is not None:
+            return items.copy()
         raise Exception("unreachable")
 
     @property
     def items(self) -> list[Episode]:
-        if self._items is None:
-            self._cache.load(uri=self._uri)
-        if self._items is not None:
-            return self._items.copy()
+        items = self._items
+        while items is None and self._cache.load(uri=self._uri):
+            items = self._items
+        if items is not None:
+            return items.copy()
         raise Exception("unreachable")
 
     @property
@@ -132,18 +185,20 @@ class Show(PlayContext):
 
         :return: [{'height': (int | None), 'width': (int | None), 'url': str}]
         """
-        if self._images is None:
-            self._cache.load(uri=self._uri)
-        if self._images is not None:
-            return self._images.copy()
+        images = self._images
+        while images is None and self._cache.load(uri=self._uri):
+            images = self._images
+        if images is not None:
+            return images.copy()
         raise Exception("unreachable")
 
     @property
     def description(self) -> str:
-        if self._description is None:
-            self._cache.load(uri=self._uri)
-        if self._description is not None:
-            return self._description
+        description = self._description
+        while description is None and self._cache.load(uri=self._uri):
+            description = self._description
+        if description is not None:
+            return description
         raise Exception("unreachable")
 
     @staticmethod
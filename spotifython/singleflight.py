@@ -0,0 +1,73 @@
+from collections.abc import Callable, Hashable
+from typing import Any
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.thread = threading.get_ident()
+        self.waiting = 0
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent work: while a function runs for a key, other threads calling :meth:`do` with the same key
+    wait for it and share its result instead of running the function again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        copy: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        run function unless a call for key is already in flight
+
+        :param key: identifies the work
+        :param function: does the work
+        :param copy: used to hand every waiting caller its own copy of a mutable result
+        :return: the result of the call that did the work
+        :raises: the exception of the call that did the work
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            running = call is not None
+            if not running:
+                call = _Call()
+                self._calls[key] = call
+            elif call.thread != threading.get_ident():
+                call.waiting += 1
+
+        if running:
+            if call.thread == threading.get_ident():
+                # the thread running the call needs the same key again (e.g. a recursive load)
+                return function()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result if copy is None else copy(call.result)
+
+        try:
+            result = function()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            call.error = e
+            call.done.set()
+            raise
+
+        with self._lock:
+            del self._calls[key]
+            waiting = call.waiting
+        # keep a private snapshot since the caller may change its result as soon as it is returned
+        call.result = result if copy is None or waiting == 0 else copy(result)
+        call.done.set()
+        return result
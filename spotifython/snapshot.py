@@ -0,0 +1,107 @@
+from collections.abc import Iterable
+import mmap
+import os
+import struct
+import tempfile
+
+from .storage import FILE_MODE
+
+# magic, number of entries, offset of the records
+_HEADER = struct.Struct("<8sQQ")
+# offset and length of the key, offset and length of the payload
+_RECORD = struct.Struct("<QIQI")
+_MAGIC = b"SPYSNAP\x01"
+
+
+def write_snapshot(path: str, entries: Iterable[tuple[str, bytes]]):
+    """
+    write a snapshot file; an existing file is replaced atomically, so processes that mapped it keep their view
+
+    :param path: path of the file
+    :param entries: (key, payload) for every element
+    """
+    entries = sorted(
+        ((key.encode("utf8"), payload) for key, payload in entries),
+        key=lambda entry: entry[0],
+    )
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as out_file:
+            out_file.write(b"\0" * _HEADER.size)
+            records = []
+            offset = _HEADER.size
+            for key, payload in entries:
+                out_file.write(key)
+                out_file.write(payload)
+                records.append(
+                    _RECORD.pack(offset, len(key), offset + len(key), len(payload))
+                )
+                offset += len(key) + len(payload)
+            out_file.write(b"".join(records))
+            out_file.seek(0)
+            out_file.write(_HEADER.pack(_MAGIC, len(records), offset))
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+class Snapshot:
+    """
+    Read-only view of a file written by :func:`write_snapshot`. The file is memory-mapped and the records are sorted by
+    key, so opening it takes constant time and lookups are a binary search without reading the rest of the file.
+
+    :param path: path of the file
+    :raises ValueError: if the file is not a snapshot
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as in_file:
+            self._mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a snapshot")
+        magic, self._count, self._records_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a snapshot")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, index: int) -> tuple[int, int, int, int]:
+        return _RECORD.unpack_from(
+            self._mmap, self._records_offset + index * _RECORD.size
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """
+        :return: the payload stored for key or None if there is none
+        """
+        encoded = key.encode("utf8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, offset, length = self._record(middle)
+            current = self._mmap[key_offset : key_offset + key_length]
+            if current == encoded:
+                return self._mmap[offset : offset + length]
+            if current < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def keys(self) -> list[str]:
+        keys = []
+        for index in range(self._count):
+            key_offset, key_length, _, _ = self._record(index)
+            keys.append(self._mmap[key_offset : key_offset + key_length].decode("utf8"))
+        return keys
+
+    def close(self):
+        self._mmap.close()
@@ -0,0 +1,534 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager
+import atexit
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import urllib.parse
+import zlib
+
+try:
+    import fcntl
+except ImportError:
+    # no locking between processes on windows
+    fcntl = None
+
+log = logging.getLogger(__name__)
+
+# mkstemp creates files only the owner can read; written files get the permissions open() would give them, so
+# processes of other users can share the cache
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+# subdirectories of FileStorage: one per element type and one for the builtin elements
+_TYPE_DIRS = (
+    "album",
+    "artist",
+    "episode",
+    "playlist",
+    "show",
+    "track",
+    "user",
+    "builtin",
+)
+
+
+class Storage(ABC):
+    """
+    Backend holding the serialized elements of the cache. Implementations have to be safe to use from multiple threads.
+    """
+
+    @abstractmethod
+    def read(self, key: str) -> bytes | None:
+        """
+        :param key: uri of the element (or name of a builtin element like "me")
+        :return: the stored payload or None if there is none
+        """
+        pass
+
+    @abstractmethod
+    def write(
+        self,
+        key: str,
+        payload: bytes,
+        type_name: str | None = None,
+        requested_time: float | None = None,
+    ):
+        """
+        store the payload of an element, replacing the previous one
+
+        :param key: uri of the element (or name of a builtin element like "me")
+        :param payload: serialized element
+        :param type_name: name of the element class
+        :param requested_time: unix time at which the data was requested from the api
+        """
+        pass
+
+    def write_many(
+        self, entries: Iterable[tuple[str, bytes, str | None, float | None]]
+    ):
+        """
+        store multiple payloads at once
+
+        :param entries: (key, payload, type_name, requested_time) like the arguments of :meth:`write`
+        """
+        for key, payload, type_name, requested_time in entries:
+            self.write(key, payload, type_name=type_name, requested_time=requested_time)
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        remove the payload of an element if it is stored
+        """
+        pass
+
+    @abstractmethod
+    def keys(self) -> list[str]:
+        """
+        :return: the keys of all stored elements
+        """
+        pass
+
+    def lock(self, key: str) -> AbstractContextManager[bool]:
+        """
+        lock a key against other processes sharing the storage while its element is requested
+
+        :return: context manager holding the lock that yields whether another process held it before
+        """
+        return contextlib.nullcontext(False)
+
+    def flush(self):
+        """
+        block until all writes have reached the underlying medium
+        """
+        pass
+
+    def close(self):
+        """
+        release the resources held by the storage
+        """
+        pass
+
+
+def _is_flat_cache_file(name: str) -> bool:
+    """
+    :return: whether name is the file name of an element in the flat layout of older versions (its uri or a builtin name)
+    """
+    if name in ("me", "saved_tracks"):
+        return True
+    parts = name.split(":")
+    return len(parts) >= 3 and parts[0] == "spotify" and all(parts)
+
+
+class FileStorage(Storage):
+    """
+    One file per element in a directory; files are replaced atomically, so several processes can share the directory.
+    The files are spread over subdirectories by element type and a hash prefix of the uri. Files of the flat layout used
+    by older versions are moved when the storage is opened.
+
+    :param cache_dir: global path to the directory to store the files in
+    """
+
+    def __init__(self, cache_dir: str):
+        assert isinstance(cache_dir, str)
+
+        self._cache_dir = cache_dir
+        self._created_dirs: set[str] = set()
+        self._lock_file = None
+        if fcntl is not None:
+            # record locks belong to the process and are released when any of its descriptors of the file is closed,
+            # so the file stays open for the lifetime of the storage
+            self._lock_file = open(os.path.join(cache_dir, ".lock"), "ab")
+        self._migrate_flat_layout()
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def _get_dir(self, key: str) -> str:
+        parts = key.split(":")
+        type_name = parts[1] if len(parts) >= 3 and parts[0] == "spotify" else "builtin"
+        prefix = hashlib.md5(key.encode("utf8"), usedforsecurity=False).hexdigest()[:2]
+        return os.path.join(self._cache_dir, type_name, prefix)
+
+    def _get_path(self, key: str) -> str:
+        # uris contain colons, which are not allowed in file names on some filesystems
+        return os.path.join(self._get_dir(key), urllib.parse.quote(key, safe=""))
+
+    def _migrate_flat_layout(self):
+        with os.scandir(self._cache_dir) as entries:
+            flat = [
+                entry.name
+                for entry in entries
+                if entry.is_file() and _is_flat_cache_file(entry.name)
+            ]
+        for key in flat:
+            path = self._get_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                if os.path.exists(path):
+                    # another process already wrote newer data
+                    os.remove(os.path.join(self._cache_dir, key))
+                else:
+                    os.replace(os.path.join(self._cache_dir, key), path)
+            except FileNotFoundError:
+                # moved by another process
+                pass
+        if flat:
+            log.info("moved %d cache files to the sharded layout", len(flat))
+
+    def read(self, key: str) -> bytes | None:
+        try:
+            with open(self._get_path(key), "rb") as in_file:
+                return in_file.read()
+        except FileNotFoundError:
+            return None
+
+    def write(
+        self,
+        key: str,
+        payload: bytes,
+        type_name: str | None = None,
+        requested_time: float | None = None,
+    ):
+        directory = self._get_dir(key)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+        # readers see either the old or the new file but never a partially written one
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out_file:
+                out_file.write(payload)
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, self._get_path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def keys(self) -> list[str]:
+        keys = []
+        for type_entry in os.scandir(self._cache_dir):
+            # other files and directories may live in the cache dir
+            if not type_entry.is_dir() or type_entry.name not in _TYPE_DIRS:
+                continue
+            for prefix_entry in os.scandir(type_entry.path):
+                if not prefix_entry.is_dir():
+                    continue
+                # skip temporary files
+                keys += [
+                    urllib.parse.unquote(name)
+                    for name in os.listdir(prefix_entry.path)
+                    if not name.startswith(".")
+                ]
+        return keys
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[bool]:
+        if self._lock_file is None:
+            yield False
+            return
+
+        # one byte of the lock file per key
+        offset = zlib.crc32(key.encode("utf8"))
+        waited = False
+        try:
+            fcntl.lockf(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, offset)
+        except OSError:
+            waited = True
+            fcntl.lockf(self._lock_file, fcntl.LOCK_EX, 1, offset)
+        try:
+            yield waited
+        finally:
+            fcntl.lockf(self._lock_file, fcntl.LOCK_UN, 1, offset)
+
+    def close(self):
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class SQLiteStorage(Storage):
+    """
+    all elements in a single sqlite database; the database is opened in WAL mode, so readers in other threads or
+    processes are not blocked by writes
+
+    :param path: path of the database file (created if it does not exist)
+    """
+
+    def __init__(self, path: str):
+        assert isinstance(path, str)
+
+        self._path = path
+        # sqlite connections may only be used by the thread that created them
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        connection = self._get_connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS elements ("
+            "key TEXT PRIMARY KEY, "
+            "type TEXT, "
+            "requested_time REAL, "
+            "payload BLOB NOT NULL"
+            ")"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS elements_type ON elements (type)"
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _get_connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # autocommit; every statement is its own transaction
+            connection = sqlite3.connect(
+                self._path, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def read(self, key: str) -> bytes | None:
+        row = (
+            self._get_connection()
+            .execute("SELECT payload FROM elements WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return None if row is None else bytes(row[0])
+
+    def write(
+        self,
+        key: str,
+        payload: bytes,
+        type_name: str | None = None,
+        requested_time: float | None = None,
+    ):
+        self._get_connection().execute(
+            "INSERT OR REPLACE INTO elements (key, type, requested_time, payload) VALUES (?, ?, ?, ?)",
+            (key, type_name, requested_time, payload),
+        )
+
+    def write_many(
+        self, entries: Iterable[tuple[str, bytes, str | None, float | None]]
+    ):
+        connection = self._get_connection()
+        # one transaction instead of one per row
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO elements (key, payload, type, requested_time) VALUES (?, ?, ?, ?)",
+                entries,
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def delete(self, key: str):
+        self._get_connection().execute("DELETE FROM elements WHERE key = ?", (key,))
+
+    def keys(self, type_name: str | None = None) -> list[str]:
+        """
+        :param type_name: only return the keys of elements of this class
+        :return: the keys of all stored elements
+        """
+        if type_name is None:
+            rows = self._get_connection().execute("SELECT key FROM elements")
+        else:
+            rows = self._get_connection().execute(
+                "SELECT key FROM elements WHERE type = ?", (type_name,)
+            )
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class WriteBehindStorage(Storage):
+    """
+    Wrapper that writes to another storage from a background thread. Writes return immediately; repeated writes of the
+    same key are coalesced and the rest is written in batches. Pending writes are flushed when the interpreter exits, and
+    the pending write of a key is written before its :meth:`lock` is released.
+
+    :param storage: storage to write to
+    :param delay: seconds to collect writes before they are written
+    :param batch_size: number of pending writes that are written without waiting for delay
+    """
+
+    def __init__(self, storage: Storage, delay: float = 1.0, batch_size: int = 500):
+        assert isinstance(storage, Storage)
+        assert isinstance(delay, (float | int)) and delay >= 0
+        assert isinstance(batch_size, int) and batch_size > 0
+
+        self._storage = storage
+        self._delay = delay
+        self._batch_size = batch_size
+        # key -> (payload, type_name, requested_time); a payload of None deletes the key
+        self._pending: dict[str, tuple[bytes | None, str | None, float | None]] = {}
+        # the batch that is being written, so reads do not miss it
+        self._writing: dict[str, tuple[bytes | None, str | None, float | None]] = {}
+        self._flushing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        atexit.register(self.flush)
+
+    @property
+    def storage(self) -> Storage:
+        return self._storage
+
+    def _get_pending(
+        self, key: str
+    ) -> tuple[bytes | None, str | None, float | None] | None:
+        if (entry := self._pending.get(key)) is not None:
+            return entry
+        return self._writing.get(key)
+
+    def read(self, key: str) -> bytes | None:
+        with self._condition:
+            entry = self._get_pending(key)
+        if entry is not None:
+            return entry[0]
+        return self._storage.read(key)
+
+    def _enqueue(
+        self,
+        key: str,
+        entry: tuple[bytes | None, str | None, float | None],
+    ):
+        with self._condition:
+            assert not self._closed
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="spotifython-write-behind", daemon=True
+                )
+                self._thread.start()
+            self._pending[key] = entry
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify_all()
+
+    def write(
+        self,
+        key: str,
+        payload: bytes,
+        type_name: str | None = None,
+        requested_time: float | None = None,
+    ):
+        self._enqueue(key, (payload, type_name, requested_time))
+
+    def delete(self, key: str):
+        self._enqueue(key, (None, None, None))
+
+    def keys(self) -> list[str]:
+        with self._condition:
+            pending = self._writing | self._pending
+        keys = set(self._storage.keys())
+        for key, (payload, _, _) in pending.items():
+            if payload is None:
+                keys.discard(key)
+            else:
+                keys.add(key)
+        return list(keys)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                # give further writes the chance to join the batch
+                self._condition.wait_for(
+                    lambda: self._flushing
+                    or self._closed
+                    or len(self._pending) >= self._batch_size,
+                    timeout=self._delay,
+                )
+                self._writing, self._pending = self._pending, {}
+                batch = self._writing
+
+            try:
+                self._storage.write_many(
+                    (key, payload, type_name, requested_time)
+                    for key, (payload, type_name, requested_time) in batch.items()
+                    if payload is not None
+                )
+                for key, (payload, _, _) in batch.items():
+                    if payload is None:
+                        self._storage.delete(key)
+                log.debug("wrote %d cached elements", len(batch))
+            except Exception:
+                log.exception("failed to write %d cached elements", len(batch))
+
+            with self._condition:
+                self._writing = {}
+                self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[bool]:
+        with self._storage.lock(key) as waited:
+            try:
+                yield waited
+            finally:
+                # processes waiting for the lock read the key from the wrapped storage as soon as it is released
+                self._write_through(key)
+
+    def _write_through(self, key: str):
+        with self._condition:
+            # an older version that is being written must not overwrite the newer one
+            self._condition.wait_for(lambda: key not in self._writing)
+            if (entry := self._pending.pop(key, None)) is None:
+                return
+            payload, type_name, requested_time = entry
+            try:
+                if payload is None:
+                    self._storage.delete(key)
+                else:
+                    self._storage.write(
+                        key, payload, type_name=type_name, requested_time=requested_time
+                    )
+            except Exception:
+                log.exception("failed to write cached element %s", key)
+
+    def flush(self):
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            self._flushing += 1
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: not self._pending and not self._writing)
+            self._flushing -= 1
+        self._storage.flush()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        atexit.unregister(self.flush)
+        self._storage.close()
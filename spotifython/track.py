@@ -3,6 +3,7 @@ from __future__ import annotations
 from spotifython.errors import SpotifyException
 
 from .connection import Connection
+from .async_connection import AsyncConnection
 from .cache import Cache
 from .uri import URI
 from .abc import Playable
@@ -36,6 +37,8 @@ class Track(Playable):
                 ret["artists"] = [
                     artist.to_dict(minimal=True) for artist in self._artists
                 ]
+            if self._requested_time is not None:
+                ret["requested_time"] = self._requested_time
         return ret
 
     @staticmethod
@@ -52,38 +55,74 @@ class Track(Playable):
             return response
         raise SpotifyException("api request got no data")
 
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "tracks/{id}".format(id=uri.id),
+            fields="uri,name,album(uri,name),artists(uri,name)",
+        )
+        response = await connection.make_request("GET", endpoint)
+        if response is not None:
+            return response
+        raise SpotifyException("api request got no data")
+
+    @staticmethod
+    def make_batch_request(
+        uris: list[URI], connection: Connection
+    ) -> list[dict | None]:
+        assert isinstance(connection, Connection)
+
+        ret = []
+        for i in range(0, len(uris), 50):
+            endpoint = connection.add_parameters_to_endpoint(
+                "tracks", ids=",".join(uri.id for uri in uris[i : i + 50])
+            )
+            if (response := connection.make_request("GET", endpoint)) is None:
+                raise SpotifyException("api request got no data")
+            ret += response["tracks"]
+        return ret
+
     def load_dict(self, data: dict):
         assert isinstance(data, dict)
         assert str(self._uri) == data["uri"]
 
         self._name = data["name"]
+        self._requested_time = data.get("requested_time")
         self._album = self._cache.get_album(
             uri=URI(data["album"]["uri"]), name=data["album"]["name"]
         )
-        self._artists = []
+        artists = []
 
         for artist in data["artists"]:
-            self._artists.append(
+            artists.append(
                 self._cache.get_artist(uri=URI(artist["uri"]), name=artist["name"])
             )
+        self._artists = artists
 
-    def is_expired(self) -> bool:
-        return False
+    def _unload(self):
+        self._album = None
+        self._artists = None
+        self._requested_time = None
 
     @property
     def album(self) -> Album:
-        if self._album is None:
-            self._cache.load(uri=self._uri)
-        if self._album is not None:
-            return self._album
+        album = self._album
+        while album is None and self._cache.load(uri=self._uri):
+            album = self._album
+        if album is not None:
+            return album
         raise Exception("unreachable")
 
     @property
     def artists(self) -> list[Artist]:
-        if self._artists is None:
-            self._cache.load(uri=self._uri)
-        if self._artists is not None:
-            return self._artists.copy()
+        artists = self._artists
+        while artists is None and self._cache.load(uri=self._uri):
+            artists = self._artists
+        if artists is not None:
+            return artists.copy()
         raise Exception("unreachable")
 
     @property
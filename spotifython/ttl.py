@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+
+DAY = 3600 * 24
+WEEK = DAY * 7
+
+
+class TTLPolicy:
+    """
+    Decides how long cached data stays valid. By default playlists, users, artists, shows and the saved tracks expire
+    after a week, the profile of the current user after a day and tracks, albums and episodes never. Elements the api
+    answered with 404 (not found) or 403 (forbidden) are not requested again for a day.
+
+    :param ttls: seconds the data of an element type stays valid keyed by element class (None to never expire); missing types keep their default
+    :param stale_while_revalidate: seconds after expiry during which the old data is still used while it is requested again in the background (math.inf to always use it)
+    :param negative_ttl: seconds a 404 or 403 response is remembered and raised again without a request (None to remember it forever, 0 to not remember it)
+    """
+
+    def __init__(
+        self,
+        ttls: dict[type, float | None] | None = None,
+        stale_while_revalidate: float = 0.0,
+        negative_ttl: float | None = DAY,
+    ):
+        assert isinstance(ttls, (dict | None))
+        assert isinstance(stale_while_revalidate, (float | int))
+        assert stale_while_revalidate >= 0
+        assert negative_ttl is None or (
+            isinstance(negative_ttl, (float | int)) and negative_ttl >= 0
+        )
+
+        self._ttls: dict[type, float | None] = {
+            Playlist: WEEK,
+            User: WEEK,
+            Artist: WEEK,
+            Show: WEEK,
+            SavedTracks: WEEK,
+            Me: DAY,
+            Track: None,
+            Album: None,
+            Episode: None,
+        }
+        if ttls is not None:
+            self._ttls.update(ttls)
+        self._stale_while_revalidate: float = stale_while_revalidate
+        self._negative_ttl: float | None = negative_ttl
+
+    @property
+    def stale_while_revalidate(self) -> float:
+        return self._stale_while_revalidate
+
+    @property
+    def negative_ttl(self) -> float | None:
+        return self._negative_ttl
+
+    def ttl(self, element_type: type) -> float | None:
+        """
+        :return: seconds the data of element_type stays valid (None if it never expires)
+        """
+        # subclasses without an own entry (e.g. Me without one would be a User) use the entry of their base class
+        for cls in element_type.__mro__:
+            if cls in self._ttls:
+                return self._ttls[cls]
+        return None
+
+    def is_expired(self, element_type: type, requested_time: float | None) -> bool:
+        """
+        :param element_type: class of the element
+        :param requested_time: unix time at which the data was requested (None if unknown)
+        """
+        if (ttl := self.ttl(element_type)) is None:
+            return False
+        if requested_time is None:
+            return True
+        return time.time() > requested_time + ttl
+
+    def is_usable_stale(self, element_type: type, requested_time: float | None) -> bool:
+        """
+        :return: whether expired data may still be used while it is requested again
+        """
+        if (ttl := self.ttl(element_type)) is None or requested_time is None:
+            return False
+        return time.time() <= requested_time + ttl + self._stale_while_revalidate
+
+    def is_negative_expired(self, requested_time: float) -> bool:
+        """
+        :param requested_time: unix time at which the api answered with 404 or 403
+        """
+        if self._negative_ttl is None:
+            return False
+        return time.time() > requested_time + self._negative_ttl
+
+
+from .playlist import Playlist
+from .user import User
+from .artist import Artist
+from .show import Show
+from .track import Track
+from .album import Album
+from .episode import Episode
+from .me import Me, SavedTracks
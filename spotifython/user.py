@@ -47,9 +47,9 @@ class User(Cacheable):
 
         self._name = data["display_name"]
 
-        self._playlists = []
+        playlists = []
         for playlist in data["playlists"]["items"]:
-            self._playlists.append(
+            playlists.append(
                 self._cache.get_playlist(
                     uri=URI(playlist["uri"]),
                     name=playlist["name"],
@@ -57,6 +57,7 @@ class User(Cacheable):
                 )
             )
         self._requested_time = data["requested_time"]
+        self._playlists = playlists
 
     @staticmethod
     def make_request(uri: URI, connection: Connection) -> dict:
@@ -72,11 +73,10 @@ class User(Cacheable):
             raise SpotifyException("api request got no data")
 
         # get playlists
-        offset = 0
         limit = 50
         endpoint = connection.add_parameters_to_endpoint(
             "users/{userid}/playlists".format(userid=uri.id),
-            offset=offset,
+            offset=0,
             limit=limit,
             fields="items(uri,name,snapshot_id)",
         )
@@ -87,36 +87,59 @@ class User(Cacheable):
             raise SpotifyException("api request got no data")
 
         # check for long data that needs paging
-        if data["next"] is not None:
-            while True:
-                endpoint = connection.add_parameters_to_endpoint(
-                    "users/{userid}/playlists".format(userid=uri.id),
-                    offset=offset,
-                    limit=limit,
-                    fields="items(uri,name,snapshot_id)",
-                )
-                offset += limit
-                if (response := connection.make_request("GET", endpoint)) is not None:
-                    extra_data = response
-                else:
-                    raise SpotifyException("api request got no data")
-                data["items"] += extra_data["items"]
-
-                if extra_data["next"] is None:
-                    break
+        data["items"] += connection.get_remaining_items(
+            "users/{userid}/playlists".format(userid=uri.id),
+            first_page=data,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
         base["playlists"] = data
         base["requested_time"] = time.time()
 
         return base
 
-    def is_expired(self) -> bool:
-        if self._requested_time is None:
-            self._cache.load(uri=self._uri)
-        if self._requested_time is not None:
-            return time.time() > self._requested_time + (
-                3600 * 24 * 7
-            )  # one week in unix time
-        raise Exception("unreachable")
+    @staticmethod
+    async def make_request_async(uri: URI, connection: AsyncConnection) -> dict:
+        assert isinstance(uri, URI)
+        assert isinstance(connection, AsyncConnection)
+
+        endpoint = connection.add_parameters_to_endpoint(
+            "users/{user_id}".format(user_id=uri.id), fields="display_name,uri"
+        )
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            base = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # get playlists
+        limit = 50
+        endpoint = connection.add_parameters_to_endpoint(
+            "users/{userid}/playlists".format(userid=uri.id),
+            offset=0,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
+
+        if (response := await connection.make_request("GET", endpoint)) is not None:
+            data = response
+        else:
+            raise SpotifyException("api request got no data")
+
+        # check for long data that needs paging
+        data["items"] += await connection.get_remaining_items(
+            "users/{userid}/playlists".format(userid=uri.id),
+            first_page=data,
+            limit=limit,
+            fields="items(uri,name,snapshot_id)",
+        )
+        base["playlists"] = data
+        base["requested_time"] = time.time()
+
+        return base
+
+    def _unload(self):
+        self._playlists = None
+        self._requested_time = None
 
     @property
     def display_name(self) -> str:
@@ -124,18 +147,20 @@ class User(Cacheable):
         Same as name
         """
 
-        if self._name is None:
-            self._cache.load(self.uri)
-        if self._name is not None:
-            return self._name
+        name = self._name
+        while name is None and self._cache.load(self.uri):
+            name = self._name
+        if name is not None:
+            return name
         raise Exception("unreachable")
 
     @property
     def playlists(self) -> list[Playlist]:
-        if self._playlists is None:
-            self._cache.load(self.uri)
-        if self._playlists is not None:
-            return self._playlists.copy()
+        playlists = self._playlists
+        while playlists is None and self._cache.load(self.uri):
+            playlists = self._playlists
+        if playlists is not None:
+            return playlists.copy()
         raise Exception("unreachable")
 
 
@@ -143,3 +168,4 @@ from .playlist import Playlist
 from .cache import Cache
 from .uri import URI
 from .connection import Connection
+from .async_connection import AsyncConnection